@@ -0,0 +1,38 @@
+"""
+JSON encoding and decoding for Inspector.
+
+Uses orjson when the optional `speedups` dependency is installed and the standard
+library json module otherwise. This module must not import anything from the
+rest of the package, so that any module can use it without import cycles.
+"""
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+
+def loads(data: bytes | str):
+    """Decode a JSON document."""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, indent: bool = False) -> bytes:
+    """
+    Encode obj as UTF-8 JSON.
+
+    Args:
+        obj: The object to encode.
+        indent: Indent nested values by two spaces instead of emitting compact JSON.
+
+    Returns:
+        The encoded JSON document.
+    """
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
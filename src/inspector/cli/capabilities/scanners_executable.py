@@ -16,9 +16,27 @@ from .scanners_installable import InstallableScanner
 
 METADATA_FETCH_TIMEOUT = 15  # seconds for executable metadata
 
+# Detector fields that executable scanners list at the top level, but that the
+# registry and the composer read from the detector's "report"
+REPORT_FIELDS = ("severity", "tags", "template")
+
 logger: Logger = logging.getLogger(__name__)
 
 
+def _nest_report_fields(detector_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of executable detector metadata in the registry's form."""
+    detector_value = {
+        key: value for key, value in detector_info.items() if key not in REPORT_FIELDS
+    }
+    report = dict(detector_info.get("report") or {})
+    for key in REPORT_FIELDS:
+        if key in detector_info:
+            report.setdefault(key, detector_info[key])
+    report.setdefault("tags", [])
+    detector_value["report"] = report
+    return detector_value
+
+
 class ExecutableInstallableScanner(InstallableScanner):
     """Handler for executable scanners."""
 
@@ -171,8 +189,8 @@ class ExecutableInstallableScanner(InstallableScanner):
                     detector_id = detector_info.get("id") or detector_info.get("name")
 
                 if detector_id:
-                    # Use the id/name as the key, store the whole dict as the value
-                    detector_value = detector_info.copy()
+                    # Use the id/name as the key, store the metadata as the value
+                    detector_value = _nest_report_fields(detector_info)
                     final_detectors_dict[
                         str(detector_id)
                     ] = detector_value  # Ensure key is string
@@ -206,24 +206,30 @@ class OutputFileAction(Action):
 
 
 class ValidateScannerTarget(Action):
-    def __call__(self, parser, namespace, value, option_string=None):
+    def __call__(self, parser, namespace, values, option_string=None):
+        values = [values] if not isinstance(values, list) else values
+        targets = [self._classify(parser, value) for value in values]
+        setattr(namespace, self.dest, targets)
+
+    @staticmethod
+    def _classify(parser, value):
         path = Path(value).expanduser().resolve()
 
         if path.is_file():
             if path.suffix == ".zip":
-                return setattr(namespace, self.dest, ("local_zip", path))
+                return ("local_zip", path)
             elif os.access(path, os.X_OK):
-                return setattr(namespace, self.dest, ("local_path", path))
+                return ("local_path", path)
             else:
                 parser.error(
                     f"Non-archive file exists but is not executable: '{value}'"
                 )
 
         elif path.is_dir():
-            return setattr(namespace, self.dest, ("local_path", path))
+            return ("local_path", path)
 
         elif re.match(r"^https?://.*\.zip$", value, re.IGNORECASE):
-            return setattr(namespace, self.dest, ("remote_zip", value))
+            return ("remote_zip", value)
 
         parser.error(f"Invalid scanner source: '{value}'")
 
@@ -533,15 +539,16 @@ class Subparsers:
     def _scanner_install(self, parent):
         install = parent.add_parser(
             "install",
-            help="Install a scanner from local path or URL.",
-            description="Install scanner plugin from directory, zip, or URL.",
+            help="Install one or more scanners from local paths or URLs.",
+            description="Install scanner plugins from directories, zips, or URLs.",
             parents=[self.parsers.dev_parser],
         )
         install.add_argument(
             "target",
             type=str,
+            nargs="+",
             action=ValidateScannerTarget,
-            help="Directory, .zip file, or remote .zip URL",
+            help="One or more directories, .zip files, or remote .zip URLs",
         )
         install.add_argument(
             "--reinstall", action="store_true", help="Reinstall if already installed."
@@ -551,14 +558,15 @@ class Subparsers:
         scanners = INSTALLED_SCANNERS
         uninstall = parent.add_parser(
             "uninstall",
-            help="Uninstall a scanner.",
-            description="Remove installed scanner plugin.",
+            help="Uninstall one or more scanners.",
+            description="Remove installed scanner plugins.",
             parents=[self.parsers.dev_parser],
         )
         uninstall.add_argument(
             "target",
+            nargs="+",
             choices=INSTALLED_SCANNERS or NO_SCANNERS_INSTALLED,
-            help="Scanner to uninstall."
+            help="Scanners to uninstall."
             + (f" Choices: {', '.join(scanners)}" if scanners else ""),
         )
 
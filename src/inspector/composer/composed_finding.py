@@ -1,6 +1,6 @@
 from pathlib import Path
 from string import Template
-from typing import Optional, Any, Dict, List, Tuple
+from typing import Optional, Any, Dict, List, Mapping, Tuple
 
 from ..models._complete.finding import CompleteFinding
 
@@ -85,7 +85,7 @@ class ComposedFinding:
         return self._issue_categories
 
     @property
-    def template(self) -> dict:
+    def template(self) -> Mapping[str, Any]:
         return self._template
 
     @property
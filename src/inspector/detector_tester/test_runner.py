@@ -5,6 +5,7 @@ Provides functionality to validate scanner outputs against predefined test cases
 
 import json
 import logging
+import re
 import shutil
 import tempfile
 import time
@@ -16,6 +17,7 @@ from pathlib import Path
 from tabulate import tabulate
 from termcolor import colored
 
+from .._json import dumps
 from ..scanner_manager import ScannerManager
 from ..scanner_registry import get_scanner_detector_names
 from .test_file_manager import DetectorTestManager
@@ -38,6 +40,29 @@ TEST_MARKERS = {
     },
 }
 
+# Annotation inverting the expectation of the test markers on the same line.
+INVERT_MARKER = ":temporarily-invert-detector-test:"
+
+# Every annotation stripped from test files before they are scanned.
+_ANNOTATION_MARKERS = (
+    *(marker for markers in TEST_MARKERS.values() for marker in markers),
+    INVERT_MARKER,
+)
+_ANNOTATION_RE = re.compile("|".join(map(re.escape, _ANNOTATION_MARKERS)))
+
+# A `//` comment holding an annotation, from its leading slashes up to the next
+# `//` comment on the same line or the end of the line.
+_ANNOTATION_COMMENT_RE = re.compile(
+    r"/*//(?:(?!//)[^\r\n])*?(?:%s)(?:(?!//)[^\r\n])*" % _ANNOTATION_RE.pattern
+)
+
+# Test marker -> "positive" or "negative".
+_MARKER_TYPES = {
+    marker: marker_type
+    for marker_type, markers in TEST_MARKERS.items()
+    for marker in markers
+}
+
 
 @dataclass
 class TestResult:
@@ -86,31 +111,35 @@ def _process_test_file(filepath: Path, detector_name: str) -> TestResult | None:
     try:
         with filepath.open("r", encoding="UTF-8") as f:
             for idx, line in enumerate(f, 1):
-                is_temporarily_inverted = ":temporarily-invert-detector-test:" in line
+                # One scan finds every annotation on the line, in order
+                found = dict.fromkeys(_ANNOTATION_RE.findall(line))
+                if not found:
+                    continue
+                is_temporarily_inverted = INVERT_MARKER in found
                 if is_temporarily_inverted:
                     logger.info(
                         f"Testing {detector_name} and encountered temporarily inverted test annotation in {filepath.parts[-1]}:{idx}"
                     )
                     logger.info(f"Line contents: {line.strip()}")
-                for marker_type, markers in TEST_MARKERS.items():
-                    for marker in markers:
-                        if marker not in line:
-                            continue
-                        if detector_name not in line:
-                            logger.warning(
-                                f"Testing {detector_name} and encountered unexpected detector name in test file {filepath.parts[-1]}:{idx}"
-                            )
-                            logger.warning(f"Line contents: {line.strip()}")
-                            continue
-                        target = _get_target_line(idx, marker)
-                        if marker_type == "positive":
-                            (
-                                negatives if is_temporarily_inverted else positives
-                            ).append(target)
-                        else:
-                            (
-                                positives if is_temporarily_inverted else negatives
-                            ).append(target)
+                for marker in found:
+                    marker_type = _MARKER_TYPES.get(marker)
+                    if marker_type is None:
+                        continue
+                    if detector_name not in line:
+                        logger.warning(
+                            f"Testing {detector_name} and encountered unexpected detector name in test file {filepath.parts[-1]}:{idx}"
+                        )
+                        logger.warning(f"Line contents: {line.strip()}")
+                        continue
+                    target = _get_target_line(idx, marker)
+                    if marker_type == "positive":
+                        (negatives if is_temporarily_inverted else positives).append(
+                            target
+                        )
+                    else:
+                        (positives if is_temporarily_inverted else negatives).append(
+                            target
+                        )
         return TestResult(true_positives=positives, true_negatives=negatives)
     except UnicodeDecodeError:
         logger.warning("Skipping %s due to Unicode decode error", filepath)
@@ -132,39 +161,58 @@ def parse_expected_results(
     return results
 
 
+def _match_test_file(
+    instance_path: Path,
+    valid_files: set[Path],
+    relative_path_mapping: dict[Path, Path],
+    test_dir: Path,
+) -> Path | None:
+    """Return the test file a finding path refers to, or None if it matches none."""
+    if instance_path in valid_files:
+        return instance_path
+
+    try:
+        if instance_path.is_absolute():
+            try:
+                rel_instance_path = instance_path.relative_to(test_dir)
+                return relative_path_mapping.get(rel_instance_path)
+            except ValueError:
+                pass
+        else:
+            return relative_path_mapping.get(instance_path)
+    except Exception as e:
+        logger.warning(f"Error matching path {instance_path}: {e}")
+    return None
+
+
 def _extract_detector_findings(
     response, valid_files: set[Path], test_dir: Path
 ) -> dict[Path, set[int]]:
     detector_findings = {}
     relative_path_mapping = {f.relative_to(test_dir): f for f in valid_files}
 
+    # Finding path -> matching test file (or None), seeded with the test files and
+    # their relative paths. Paths not seen yet are matched once and remembered,
+    # since most instances point at a handful of files.
+    path_index = {f: f for f in valid_files}
+    path_index.update(relative_path_mapping)
+
     for finding in response.findings:
         for instance in finding.instances:
-            instance_path = Path(instance.location.path)
-            matching_file = None
-
-            if instance_path in valid_files:
-                matching_file = instance_path
-            else:
-                try:
-                    if instance_path.is_absolute():
-                        try:
-                            rel_instance_path = instance_path.relative_to(test_dir)
-                            if rel_instance_path in relative_path_mapping:
-                                matching_file = relative_path_mapping[rel_instance_path]
-                        except ValueError:
-                            pass
-                    elif instance_path in relative_path_mapping:
-                        matching_file = relative_path_mapping[instance_path]
-                except Exception as e:
-                    logger.warning(f"Error matching path {instance_path}: {e}")
+            instance_path = instance.location.path
+            try:
+                matching_file = path_index[instance_path]
+            except KeyError:
+                matching_file = path_index[instance_path] = _match_test_file(
+                    Path(instance_path), valid_files, relative_path_mapping, test_dir
+                )
 
             if matching_file:
                 detector_findings.setdefault(matching_file, set()).add(
                     instance.location.position.start.line
                 )
             else:
-                logger.warning(f"Could not match finding path: {instance_path}")
+                logger.warning(f"Could not match finding path: {Path(instance_path)}")
 
     return detector_findings
 
@@ -176,14 +224,31 @@ def _compute_detector_accuracy(
     For a single detector, compare expected results with actual findings,
     returning both accuracy metrics and detailed differences.
     """
+    return _compare_findings(
+        {
+            path: frozenset(exp_result.true_positives)
+            for path, exp_result in expected_results.items()
+        },
+        actual_findings,
+    )
+
+
+def _compare_findings(
+    expected_positives: dict[Path, frozenset[int]],
+    actual_findings: dict[Path, set[int]],
+) -> tuple[Accuracy, dict[Path, dict[str, list[int]]]]:
+    """
+    Compare the expected positive lines of each file with the actual findings.
+    """
     total_expected = 0
     total_actual = 0
+    total_false_positives = 0
+    total_false_negatives = 0
     differences = {}
+    no_findings = frozenset()
 
-    for path, exp_result in expected_results.items():
-        exp_positives = set(exp_result.true_positives)
-        total_expected += len(exp_positives)
-        actual = actual_findings.get(path, set())
+    for path, exp_positives in expected_positives.items():
+        actual = actual_findings.get(path, no_findings)
         false_positives = actual - exp_positives
         false_negatives = exp_positives - actual
         if false_positives or false_negatives:
@@ -191,18 +256,17 @@ def _compute_detector_accuracy(
                 "false_positives": sorted(false_positives),
                 "false_negatives": sorted(false_negatives),
             }
+        total_expected += len(exp_positives)
         total_actual += len(exp_positives & actual)
+        total_false_positives += len(false_positives)
+        total_false_negatives += len(false_negatives)
 
     accuracy = Accuracy(
         expected_positives=total_expected,
         actual_positives=total_actual,
         total_findings=sum(len(f) for f in actual_findings.values()),
-        false_positives=sum(
-            len(diff["false_positives"]) for diff in differences.values()
-        ),
-        false_negatives=sum(
-            len(diff["false_negatives"]) for diff in differences.values()
-        ),
+        false_positives=total_false_positives,
+        false_negatives=total_false_negatives,
     )
     return accuracy, differences
 
@@ -224,6 +288,17 @@ def analyze_results(
     """
     results = {}
 
+    # Expected positive lines per detector, merged across test_projects. These
+    # are the same for every scanner, so they are built once.
+    expected_positives = {}
+    for detector_name, detector_test_projects in expected.items():
+        merged_expected_positives = expected_positives[detector_name] = {}
+        for test_project_results in detector_test_projects.values():
+            merged_expected_positives.update(
+                (path, frozenset(exp_result.true_positives))
+                for path, exp_result in test_project_results.items()
+            )
+
     for scanner_id, scanner_findings in actual.items():
         scanner_results = ScannerResults()
 
@@ -238,15 +313,10 @@ def analyze_results(
 
             scanner_results.findings[detector_name] = merged_detector_findings
 
-            # Get expected results for this detector (merged across all test_projects)
-            if detector_name in expected:
-                merged_expected_results = {}
-                for test_project_results in expected[detector_name].values():
-                    merged_expected_results.update(test_project_results)
-
+            if detector_name in expected_positives:
                 # Compute accuracy
-                coverage, diffs = _compute_detector_accuracy(
-                    merged_expected_results, merged_detector_findings
+                coverage, diffs = _compare_findings(
+                    expected_positives[detector_name], merged_detector_findings
                 )
                 scanner_results.accuracy[detector_name] = coverage
                 if diffs:
@@ -350,7 +420,7 @@ def format_differences_json(results: dict[str, ScannerResults]) -> str:
             scanner_diff[detector_name] = detector_diff
         differences[scanner_id] = scanner_diff
 
-    return json.dumps(differences, indent=2)
+    return dumps(differences, indent=True).decode()
 
 
 def scan_with_single_detector_test_project(
@@ -770,42 +840,4 @@ def create_annotation_free_test_project(
 
 def _remove_test_annotations(content: str) -> str:
     """Remove test annotations from file content while preserving comments structure."""
-    lines = content.splitlines(True)  # Keep line endings
-    cleaned_lines = []
-
-    for line in lines:
-        cleaned_line = line
-
-        # Check for test markers and temporarily-invert-detector-test annotation
-        markers_to_check = [
-            marker for marker_list in TEST_MARKERS.values() for marker in marker_list
-        ]
-        markers_to_check.append(":temporarily-invert-detector-test:")
-
-        for marker in markers_to_check:
-            if marker in cleaned_line:
-                marker_pos = cleaned_line.find(marker)
-                comment_start = cleaned_line.rfind("//", 0, marker_pos)
-
-                if comment_start != -1:
-                    # Adjust comment_start to include any preceding slashes
-                    while comment_start > 0 and cleaned_line[comment_start - 1] == "/":
-                        comment_start -= 1
-
-                    # Find next comment if any
-                    next_comment = cleaned_line.find("//", marker_pos + len(marker))
-
-                    if next_comment != -1:
-                        # Replace just this comment
-                        cleaned_line = (
-                            cleaned_line[:comment_start] + cleaned_line[next_comment:]
-                        )
-                    else:
-                        # Remove to end of line, preserving newline
-                        cleaned_line = cleaned_line[:comment_start]
-                        if line.endswith("\n"):
-                            cleaned_line += "\n"
-
-        cleaned_lines.append(cleaned_line)
-
-    return "".join(cleaned_lines)
+    return _ANNOTATION_COMMENT_RE.sub("", content)
@@ -1,14 +1,18 @@
-import json
+import os
+import stat
 import logging
 import glob
 import argparse
 
+from collections.abc import Iterator
 from glob import has_magic
+from itertools import chain
 from pathlib import Path
 
 from halo import Halo
 
 from . import __version__ as version
+from ._json import dumps
 from .scanner_manager import ScannerManager
 from .scanner_registry import get_scanner_version
 
@@ -38,23 +42,21 @@ def smart_resolve_path(
     2. If relative and exists relative to preferred root (project or cwd), return that.
     3. Else, return None (invalid).
     """
-    raw_path = Path(str(raw_entry).strip())
+    # Work on realpath strings and only build a Path for the result
+    raw_entry = str(raw_entry).strip()
 
     # 1. Absolute and valid
-    if raw_path.is_absolute() and raw_path.exists():
-        return raw_path.resolve()
+    if os.path.isabs(raw_entry) and os.path.exists(raw_entry):
+        return Path(os.path.realpath(raw_entry))
 
     # 2. Relative, prefer project root if requested
-    rel_roots = (
-        [project_root, Path.cwd()]
-        if prefer_project_root
-        else [Path.cwd(), project_root]
-    )
+    cwd = os.getcwd()
+    rel_roots = [project_root, cwd] if prefer_project_root else [cwd, project_root]
 
     for base in rel_roots:
-        candidate = (base / raw_path).resolve()
-        if candidate.exists():
-            return candidate
+        candidate = os.path.realpath(os.path.join(base, raw_entry))
+        if os.path.exists(candidate):
+            return Path(candidate)
 
     return None
 
@@ -71,6 +73,16 @@ def normalize_and_expand_paths(
     valid_paths = set()
     invalid_paths = set()
 
+    # Plain entries repeated within this call are only resolved once
+    resolved_entries: dict[str, Path | None] = {}
+
+    # The search roots only depend on the call, not on the entry
+    rel_roots = (
+        [project_root, Path.cwd()]
+        if prefer_project_root
+        else [Path.cwd(), project_root]
+    )
+
     for entry in raw_inputs:
         entry = str(entry).strip()
         if not entry or entry.startswith("#"):
@@ -81,15 +93,9 @@ def normalize_and_expand_paths(
             )
 
         # Expand globs first (relative to root or cwd depending on source)
-        path_obj = Path(entry.strip())
-        rel_roots = (
-            [project_root, Path.cwd()]
-            if prefer_project_root
-            else [Path.cwd(), project_root]
-        )
-        matched = []
-
         if has_magic(entry):
+            path_obj = Path(entry)
+            matched = []
             for root in rel_roots:
                 globbed = glob.glob(str(root / path_obj), recursive=True)
                 matched.extend(globbed)
@@ -98,7 +104,11 @@ def normalize_and_expand_paths(
             else:
                 invalid_paths.add(path_obj)
         else:
-            resolved = smart_resolve_path(entry, project_root, prefer_project_root)
+            if entry not in resolved_entries:
+                resolved_entries[entry] = smart_resolve_path(
+                    entry, project_root, prefer_project_root
+                )
+            resolved = resolved_entries[entry]
             if resolved:
                 valid_paths.add(resolved)
             else:
@@ -135,15 +145,20 @@ def code_location_expander(values: set[Path]) -> set[Path]:
         A set of Path objects representing all files found.
     """
 
-    def expand_path(path: Path) -> set[Path]:
-        abs_path = path.resolve()
-        if abs_path.is_dir():
-            return set(get_all_files_in_directory(abs_path))
-        elif abs_path.is_file():
-            return {abs_path}
-        return set()
+    def expand_path(path: Path) -> Iterator[str]:
+        abs_path = os.path.realpath(path)
+        if os.path.isdir(abs_path):
+            for dirpath, _, filenames in os.walk(abs_path):
+                for filename in filenames:
+                    file = os.path.join(dirpath, filename)
+                    if os.path.isfile(file):
+                        yield file
+        elif os.path.isfile(abs_path):
+            yield abs_path
 
-    return {file for path in values if path for file in expand_path(path)}
+    # Deduplicate on plain path strings, then build each Path exactly once
+    files = set(chain.from_iterable(expand_path(path) for path in values if path))
+    return {Path(file) for file in files}
 
 
 def get_version_info(scan_results, format: str = "md") -> str:
@@ -184,7 +199,7 @@ def get_version_info_json_string(scan_results) -> str:
 
     for scanner in scan_results:
         version_info[scanner] = get_scanner_version(scanner)
-    return json.dumps(version_info)
+    return dumps(version_info).decode()
 
 
 def is_valid_scanner_directory(directory_path, required_files=None):
@@ -203,10 +218,11 @@ def is_valid_scanner_directory(directory_path, required_files=None):
         bool: True if the directory is a valid scanner directory, False otherwise
     """
 
-    # Convert to Path object if it's not already
-    directory = Path(directory_path)
-
-    if not directory.is_dir():
+    # One stat per candidate path: read st_mode and test the bits directly
+    try:
+        if not stat.S_ISDIR(os.stat(directory_path).st_mode):
+            return False
+    except (OSError, ValueError):
         return False
 
     # Default to looking for pyproject.toml if no files specified
@@ -214,16 +230,22 @@ def is_valid_scanner_directory(directory_path, required_files=None):
         required_files = ["pyproject.toml"]
 
     # Check if there's a single executable file
-    for file_path in directory.iterdir():
-        if (
-            file_path.is_file() and file_path.stat().st_mode & 0o111
-        ):  # Check executable bit
-            return True
+    with os.scandir(directory_path) as entries:
+        for entry in entries:
+            try:
+                mode = entry.stat().st_mode
+            except OSError:
+                continue
+            if stat.S_ISREG(mode) and mode & 0o111:  # Check executable bit
+                return True
 
     # Check if any of the required files exist
     for req_file in required_files:
-        if (directory / req_file).is_file():
-            return True
+        try:
+            if stat.S_ISREG(os.stat(os.path.join(directory_path, req_file)).st_mode):
+                return True
+        except OSError:
+            continue
 
     return False
 
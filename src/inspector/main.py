@@ -86,20 +86,22 @@ def main():
             raise SystemExit()
 
         elif args.scanner_action == "install":
-            # Install scanner from specified target
-            scanner_install_type, scanner_install_target = args.target
+            # Install scanners from the specified targets, in order, writing the
+            # registry once for all of them
             try:
-                status_spinner.start("Installing requested scanner...")
-                install(
-                    "scanner",
-                    scanner_install_type,
-                    scanner_install_target,
-                    reinstall=getattr(args, "reinstall", False),
-                    develop=args.dev,
-                )
-                status_spinner.succeed(
-                    f"Installed scanner successfully: {scanner_install_target}"
-                )
+                with scanner_registry.bulk_update():
+                    for scanner_install_type, scanner_install_target in args.target:
+                        status_spinner.start("Installing requested scanner...")
+                        install(
+                            "scanner",
+                            scanner_install_type,
+                            scanner_install_target,
+                            reinstall=getattr(args, "reinstall", False),
+                            develop=args.dev,
+                        )
+                        status_spinner.succeed(
+                            f"Installed scanner successfully: {scanner_install_target}"
+                        )
                 raise SystemExit()
             except (
                 ScannerAlreadyInstalledError,
@@ -118,13 +120,16 @@ def main():
                 raise SystemExit(1)
 
         elif args.scanner_action == "uninstall":
-            # Uninstall specified scanner
+            # Uninstall the specified scanners, in order, writing the registry
+            # once for all of them
             try:
-                status_spinner.start("Uninstalling requested scanner...")
-                uninstall("scanner", args.target)
-                status_spinner.succeed(
-                    f"Uninstalled scanner successfully: {args.target}"
-                )
+                with scanner_registry.bulk_update():
+                    for scanner_name in args.target:
+                        status_spinner.start("Uninstalling requested scanner...")
+                        uninstall("scanner", scanner_name)
+                        status_spinner.succeed(
+                            f"Uninstalled scanner successfully: {scanner_name}"
+                        )
                 raise SystemExit()
             except (InstallationError, ScannerAlreadyInstalledError) as e:
                 status_spinner.fail(f"Uninstall error: {str(e)}")
@@ -1,7 +1,64 @@
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=None)
+def _normalize_path_str(raw: str) -> str:
+    """
+    Normalize a raw path string exactly as `Path` would and intern the result.
+
+    Args:
+        raw: The path string to normalize.
+
+    Returns:
+        The interned, normalized path string.
+    """
+    return sys.intern(str(Path(raw)))
+
+
+@lru_cache(maxsize=None)
+def _path_from_str(path_str: str) -> Path:
+    """
+    Return the shared `Path` for a normalized path string.
+
+    Args:
+        path_str: A normalized path string.
+
+    Returns:
+        A Path instance, shared by every location pointing at the same file.
+    """
+    return Path(path_str)
+
+
+class _InternedPath:
+    """
+    Dataclass field descriptor that stores a path as an interned string and
+    only hands out a `Path` when read.
+    """
+
+    def __set_name__(self, owner, name: str) -> None:
+        self._attr = f"_{name}_str"
+
+    def __get__(self, obj, objtype=None) -> Path | str:
+        if obj is None:
+            # Accessed on the class: this is the dataclass field default
+            return "."
+        return _path_from_str(getattr(obj, self._attr))
+
+    def __set__(self, obj, value: str | Path) -> None:
+        setattr(
+            obj,
+            self._attr,
+            (
+                sys.intern(str(value))
+                if isinstance(value, Path)
+                else _normalize_path_str(str(value))
+            ),
+        )
+
+
 @dataclass
 class LocationPoint:
     """
@@ -45,16 +102,29 @@ class Location:
     """
     Describes where a code issue is located within a file.
 
+    The path is kept as an interned string, so locations pointing at the same
+    file share a single string and a single `Path` object.
+
     Attributes:
-        path: Path to the file (relative or absolute).
+        path: Path to the file (relative or absolute). Accepts a `str` or `Path`.
         start: Start point of the issue.
         end: End point of the issue.
     """
 
-    path: Path = field(default_factory=Path)
+    path: Path = _InternedPath()
     start: LocationPoint = field(default_factory=lambda: LocationPoint(0, 0, 0))
     end: LocationPoint = field(default_factory=lambda: LocationPoint(0, 0, 0))
 
+    @property
+    def path_str(self) -> str:
+        """
+        Return the interned, normalized path string.
+
+        Returns:
+            The path as a string.
+        """
+        return self._path_str
+
     @property
     def position(self) -> Position:
         """
@@ -95,7 +165,7 @@ class Location:
             A dictionary with path and position data.
         """
         return {
-            "path": str(self.path),
+            "path": self.path_str,
             "position": {
                 "start": {
                     "col": self.start.col,
@@ -113,7 +183,7 @@ class Location:
     @classmethod
     def from_dict(cls, data: dict) -> "Location":
         return cls(
-            path=Path(data["path"]),
+            path=data["path"],
             start=LocationPoint.from_dict(data["start"]),
             end=LocationPoint.from_dict(data["end"]),
         )
@@ -41,9 +41,6 @@ class MinimalDetectorResponse:
             A MinimalDetectorResponse object.
         """
         return cls(
-            findings=[
-                MinimalFinding.from_dict(finding_data)
-                for finding_data in data.get("findings", [])
-            ],
-            errors=data.get("errors", []),
+            findings=list(map(MinimalFinding.from_dict, data.get("findings", ()))),
+            errors=list(data.get("errors", ())),
         )
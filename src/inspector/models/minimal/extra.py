@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Extra:
     """
     Additional metadata associated with an instance, including known metavariables
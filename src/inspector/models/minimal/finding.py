@@ -37,8 +37,5 @@ class MinimalFinding:
             A MinimalFinding object.
         """
         return cls(
-            instances=[
-                MinimalInstance.from_dict(instance_data)
-                for instance_data in data.get("instances", [])
-            ]
+            instances=list(map(MinimalInstance.from_dict, data.get("instances", ())))
         )
@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from .extra import Extra
 
 
-@dataclass
+@dataclass(slots=True)
 class MinimalInstance:
     """
     A minimal representation of a single code issue instance.
@@ -23,6 +23,7 @@ class MinimalInstance:
     extra: Extra = field(default_factory=Extra)
 
     def __json__(self) -> dict:
+        # A dict display with constant keys is built pre-sized in one step
         return {
             "path": self.path,
             "offset_start": self.offset_start,
@@ -46,13 +46,15 @@ class MinimalScannerResponse:
         Returns:
             A MinimalScannerResponse object.
         """
+        # Scanners emit "responses" (matching __json__); "detector_responses"
+        # is the legacy key and takes precedence when present
+        responses_data = data.get("detector_responses") or data.get("responses") or {}
+        detector_response_from_dict = MinimalDetectorResponse.from_dict
         return cls(
-            errors=data.get("errors", []),
-            scanned=data.get("scanned", []),
+            errors=list(data.get("errors", ())),
+            scanned=list(data.get("scanned", ())),
             responses={
-                detector_id: MinimalDetectorResponse.from_dict(detector_data)
-                for detector_id, detector_data in data.get(
-                    "detector_responses", {}
-                ).items()
+                detector_id: detector_response_from_dict(detector_data)
+                for detector_id, detector_data in responses_data.items()
             },
         )
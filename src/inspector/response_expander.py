@@ -14,34 +14,31 @@ from .models.minimal.scanner_response import MinimalScannerResponse
 from .models.minimal.instance import MinimalInstance
 
 
-def minimal_instance_to_instance(
+def _build_instance(
     minimal_instance: MinimalInstance,
+    full_path: Path,
+    start: tuple[int, int],
+    end: tuple[int, int],
     scm: SourceCodeManager,
-    project_root: Path,
 ) -> CompleteInstance:
     """
-    Convert a MinimalInstance to a CompleteInstance.
+    Build a CompleteInstance from a MinimalInstance and its resolved positions.
 
     Args:
         minimal_instance: The minimal instance to convert.
+        full_path: Absolute path of the instance's file.
+        start: (line, col) of the start offset.
+        end: (line, col) of the end offset.
         scm: SourceCodeManager instance.
-        project_root: Project root path to resolve relative file paths.
 
     Returns:
         A CompleteInstance.
     """
-    relative_path = Path(minimal_instance.path)
-    full_path = project_root / relative_path
-
-    scm.load_file(full_path)
-
-    start_line, start_col = scm.offset_to_line_col(
-        full_path, minimal_instance.offset_start
-    )
-    end_line, end_col = scm.offset_to_line_col(full_path, minimal_instance.offset_end)
+    start_line, start_col = start
+    end_line, end_col = end
 
     location = Location(
-        path=relative_path,
+        path=minimal_instance.path,
         start=LocationPoint(
             col=start_col,
             line=start_line,
@@ -66,6 +63,30 @@ def minimal_instance_to_instance(
     )
 
 
+def minimal_instance_to_instance(
+    minimal_instance: MinimalInstance,
+    scm: SourceCodeManager,
+    project_root: Path,
+) -> CompleteInstance:
+    """
+    Convert a MinimalInstance to a CompleteInstance.
+
+    Args:
+        minimal_instance: The minimal instance to convert.
+        scm: SourceCodeManager instance.
+        project_root: Project root path to resolve relative file paths.
+
+    Returns:
+        A CompleteInstance.
+    """
+    full_path = project_root / minimal_instance.path
+
+    start, end = scm.offsets_to_line_cols(
+        full_path, [minimal_instance.offset_start, minimal_instance.offset_end]
+    )
+    return _build_instance(minimal_instance, full_path, start, end, scm)
+
+
 def minimal_finding_to_finding(
     minimal_finding: MinimalFinding,
     scm: SourceCodeManager,
@@ -74,6 +95,9 @@ def minimal_finding_to_finding(
     """
     Convert a MinimalFinding to a CompleteFinding.
 
+    Instances are grouped by file so that each file's offsets are resolved
+    in a single batch.
+
     Args:
         minimal_finding: The minimal finding to convert.
         scm: SourceCodeManager instance.
@@ -82,10 +106,31 @@ def minimal_finding_to_finding(
     Returns:
         A CompleteFinding.
     """
-    full_instances = [
-        minimal_instance_to_instance(minimal_instance, scm, project_root)
-        for minimal_instance in minimal_finding.instances
-    ]
+    instances_by_path: dict[str, list[int]] = {}
+    for index, minimal_instance in enumerate(minimal_finding.instances):
+        instances_by_path.setdefault(minimal_instance.path, []).append(index)
+
+    full_instances: list[CompleteInstance | None] = [None] * len(
+        minimal_finding.instances
+    )
+    for relative_path, indexes in instances_by_path.items():
+        full_path = project_root / relative_path
+        group = [minimal_finding.instances[index] for index in indexes]
+
+        offsets = []
+        for minimal_instance in group:
+            offsets.append(minimal_instance.offset_start)
+            offsets.append(minimal_instance.offset_end)
+        positions = scm.offsets_to_line_cols(full_path, offsets)
+
+        for n, (index, minimal_instance) in enumerate(zip(indexes, group)):
+            full_instances[index] = _build_instance(
+                minimal_instance,
+                full_path,
+                positions[2 * n],
+                positions[2 * n + 1],
+                scm,
+            )
 
     return CompleteFinding(
         instances=full_instances,
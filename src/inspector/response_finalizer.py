@@ -23,17 +23,18 @@ def responses_finalizer(
             - Count of total unique files scanned across all scanners
     """
     complete_detector_responses: dict[str, CompleteDetectorResponse] = {}
-    unique_files: set[Path] = set()
+    # Collect normalized path strings and only build Path objects once at the end
+    unique_paths: set[str] = set()
 
     for scanner_name, scanner_response in scanner_responses.items():
         # Add scanned files from top-level scanner metadata
-        unique_files.update(Path(p) for p in scanner_response.scanned)
+        unique_paths.update(str(Path(p)) for p in scanner_response.scanned)
 
         for detector_id, detector_response in scanner_response.responses.items():
             # Add scanned files from findings' instance locations
             for finding in detector_response.findings:
                 for instance in finding.instances:
-                    unique_files.add(instance.location.path)
+                    unique_paths.add(instance.location.path_str)
 
             # Attach metadata if available
             metadata = scanner_registry.get_scanner_detector_info(
@@ -54,4 +55,4 @@ def responses_finalizer(
                 )
             complete_detector_responses[full_key] = detector_response
 
-    return complete_detector_responses, unique_files
+    return complete_detector_responses, {Path(p) for p in unique_paths}
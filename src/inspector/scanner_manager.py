@@ -187,6 +187,7 @@ class ScannerManager:
 
     _instance: "ScannerManager | None" = None
     _initialized: bool = False
+    _detectors_loaded: bool = False
     _scanners: dict[str, AbstractScannerRunner] = {}
     _all_detector_names: tuple[str, ...] = ()
     _all_detector_metadata: dict[str, dict] = {}
@@ -206,11 +207,22 @@ class ScannerManager:
             self.__class__._initialized = True
 
     def _initialize_scanners(self) -> None:
-        """Initialize scanners and detectors if not already loaded."""
+        """
+        Initialize scanners if not already loaded.
+
+        Detector metadata is not loaded here; it is collected from the scanners
+        the first time it is requested (see _ensure_detectors_loaded).
+        """
         if not self._scanners:
             self._load_scanners()
-        if not self._all_detector_metadata:
-            self._load_all_detectors()
+
+    @classmethod
+    def _ensure_detectors_loaded(cls) -> None:
+        """Load detector metadata from all scanners on first access."""
+        if not cls._initialized:
+            cls()
+        if not cls._detectors_loaded:
+            cls()._load_all_detectors()
 
     @classmethod
     def reload(cls) -> None:
@@ -225,6 +237,7 @@ class ScannerManager:
         cls._all_detector_names = ()
         cls._all_scanners = ()
         cls._initialized = False
+        cls._detectors_loaded = False
 
         # Reload registry
         scanner_registry.reload()
@@ -285,8 +298,7 @@ class ScannerManager:
         Returns:
             Tuple of detector names
         """
-        if not cls._initialized:
-            cls()
+        cls._ensure_detectors_loaded()
         return cls._all_detector_names
 
     @classmethod
@@ -294,8 +306,7 @@ class ScannerManager:
         """
         Get all available detector metadata.
         """
-        if not cls._initialized:
-            cls()
+        cls._ensure_detectors_loaded()
         return cls._all_detector_metadata
 
     @classmethod
@@ -305,8 +316,7 @@ class ScannerManager:
         """
         Get all available detector metadata.
         """
-        if not cls._initialized:
-            cls()
+        cls._ensure_detectors_loaded()
         return cls._all_detector_metadata.get(detector_name, None)
 
     @classmethod
@@ -389,6 +399,7 @@ class ScannerManager:
         self.__class__._all_detector_names = tuple(
             sorted(self.__class__._all_detector_metadata.keys())
         )
+        self.__class__._detectors_loaded = True
 
     @classmethod
     def _load_scanners(cls) -> None:
@@ -409,44 +420,76 @@ class ScannerManager:
 
         # Load each scanner
         for scanner_info in scanners_info:
-            scanner_name = scanner_info["name"]
-            scanner_path = Path(scanner_info.get("path", ""))
+            cls._load_scanner(scanner_info)
+
+        cls._all_scanners = tuple(scanner for scanner in cls._scanners.values())
+
+    @classmethod
+    def add_installed(cls, scanner_name: str) -> None:
+        """
+        Load a single newly installed scanner without a full reload.
+
+        The scanner must already be recorded in the scanner registry. Only this
+        scanner is loaded; detector metadata is recollected on next access.
+
+        Args:
+            scanner_name: Name of the installed scanner
+
+        Raises:
+            KeyError: If the scanner is not in the registry
+        """
+        scanner_info = scanner_registry.get_scanner_info(scanner_name)
+        if scanner_info is None:
+            raise KeyError(f"Scanner '{scanner_name}' not found in registry")
+
+        if not cls._initialized:
+            # The first initialization loads every registered scanner, this one included
+            cls()
+            return
+
+        cls._load_scanner({**scanner_info, "name": scanner_name})
+        cls._all_scanners = tuple(cls._scanners.values())
+        cls._detectors_loaded = False
+
+    @classmethod
+    def _load_scanner(cls, scanner_info: dict) -> None:
+        """
+        Load one scanner from its registry entry based on its recorded type.
+
+        Failures are logged and the scanner is skipped.
+        """
+        scanner_name = scanner_info["name"]
+        scanner_path = Path(scanner_info.get("path", ""))
+
+        try:
+            # Convert string type to enum
+            scanner_type_str = scanner_info.get("type", "unknown")
+            scanner_type = ScannerType(scanner_type_str)
 
             try:
-                # Convert string type to enum
-                scanner_type_str = scanner_info.get("type", "unknown")
-                scanner_type = ScannerType(scanner_type_str)
-
-                try:
-                    # Load scanner based on its type
-                    if scanner_type == ScannerType.PYTHON:
-                        cls._logger.debug(f"Loading Python scanner: {scanner_name}")
-                        cls._load_python_scanner(scanner_name, scanner_path)
-                    elif scanner_type == ScannerType.EXECUTABLE:
-                        executable_path = scanner_path
-                        if executable_path.exists() and os.access(
-                            executable_path, os.X_OK
-                        ):
-                            cls._logger.debug(
-                                f"Loading executable scanner: {scanner_name}"
-                            )
-                            cls._scanners[scanner_name] = ExecutableScannerRunner(
-                                executable_path, scanner_name
-                            )
-                        else:
-                            cls._logger.warning(
-                                f"Scanner executable not found or not executable: {executable_path}"
-                            )
+                # Load scanner based on its type
+                if scanner_type == ScannerType.PYTHON:
+                    cls._logger.debug(f"Loading Python scanner: {scanner_name}")
+                    cls._load_python_scanner(scanner_name, scanner_path)
+                elif scanner_type == ScannerType.EXECUTABLE:
+                    executable_path = scanner_path
+                    if executable_path.exists() and os.access(executable_path, os.X_OK):
+                        cls._logger.debug(f"Loading executable scanner: {scanner_name}")
+                        cls._scanners[scanner_name] = ExecutableScannerRunner(
+                            executable_path, scanner_name
+                        )
                     else:
                         cls._logger.warning(
-                            f"Unknown scanner type '{scanner_type}' for scanner '{scanner_name}'"
+                            f"Scanner executable not found or not executable: {executable_path}"
                         )
-                except Exception as e:
-                    cls._logger.warning(f"Failed to load scanner {scanner_name}: {e}")
-            except ValueError as e:
-                cls._logger.warning(f"Invalid scanner type for {scanner_name}: {e}")
-
-        cls._all_scanners = tuple(scanner for scanner in cls._scanners.values())
+                else:
+                    cls._logger.warning(
+                        f"Unknown scanner type '{scanner_type}' for scanner '{scanner_name}'"
+                    )
+            except Exception as e:
+                cls._logger.warning(f"Failed to load scanner {scanner_name}: {e}")
+        except ValueError as e:
+            cls._logger.warning(f"Invalid scanner type for {scanner_name}: {e}")
 
     @classmethod
     def _load_python_scanner(cls, scanner_dir: str, scanner_path: Path) -> None:
@@ -8,9 +8,16 @@ as well as filtering based on tags and severities.
 The registry is loaded once when the module is imported and can be reloaded on demand.
 """
 
-import json
 import logging
+import os
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from itertools import chain
 from pathlib import Path
+from types import MappingProxyType
+from typing import Iterable, Iterator
+from ._json import dumps, loads
 from .constants import PATH_USER_INSPECTOR_SCANNERS_REGISTRY
 
 _logger = logging.getLogger(__name__)
@@ -18,20 +25,148 @@ _logger = logging.getLogger(__name__)
 # Internal in-memory scanner registry.
 _registry: dict[str, dict] = {}
 
+# Registry path that keeps the registry in memory, never reading or writing a file.
+IN_MEMORY_PATH = Path(":memory:")
+
 # Path to the persistent registry JSON file.
 _registry_path: Path = PATH_USER_INSPECTOR_SCANNERS_REGISTRY
 
+# Nesting depth of bulk_update() blocks, and whether they deferred a save.
+_bulk_depth: int = 0
+_pending_save: bool = False
+
+
+@dataclass
+class _RegistryIndexes:
+    """
+    Inverted indexes over the detectors of one registry snapshot.
+
+    Every (scanner, detector) pair is stored once in `entries`, in registry order;
+    the lookup tables map a scanner, detector name, tag or severity to positions
+    in that list.
+    """
+
+    registry: dict[str, dict]
+    entries: list[tuple[str, str, dict]] = field(default_factory=list)
+    by_scanner: dict[str, list[int]] = field(default_factory=dict)
+    by_detector: dict[str, set[int]] = field(default_factory=dict)
+    by_tag: dict[str, set[int]] = field(default_factory=dict)
+    by_severity: dict[str, set[int]] = field(default_factory=dict)
+    # Sorted detector names per scanner, filled in as scanners are queried.
+    detector_names: dict[str, tuple[str, ...]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, registry: dict[str, dict]) -> "_RegistryIndexes":
+        indexes = cls(registry)
+        for scanner_name, scanner_info in registry.items():
+            if "detectors" not in scanner_info or not scanner_info["detectors"]:
+                continue
+
+            positions = indexes.by_scanner.setdefault(scanner_name, [])
+            for detector_name, detector_info in scanner_info["detectors"].items():
+                position = len(indexes.entries)
+                indexes.entries.append((scanner_name, detector_name, detector_info))
+                positions.append(position)
+                indexes.by_detector.setdefault(detector_name, set()).add(position)
+
+                report = detector_info.get("report")
+                if report is None:
+                    continue
+                for tag in report.get("tags", []):
+                    indexes.by_tag.setdefault(tag, set()).add(position)
+                if "severity" in report:
+                    indexes.by_severity.setdefault(report["severity"], set()).add(
+                        position
+                    )
+        return indexes
+
+    def select(
+        self,
+        scanners: list[str] | None = None,
+        detectors: list[str] | None = None,
+        tags: list[str] | None = None,
+        severities: list[str] | None = None,
+    ) -> Iterable[tuple[str, str, dict]]:
+        """
+        Yield the (scanner, detector, detector_info) entries matching all criteria.
+
+        Entries come in registry order, or grouped by scanner in the given order
+        when `scanners` is set. Empty criteria match everything.
+        """
+        selected: set[int] | None = None
+        if detectors:
+            selected = set().union(*(self.by_detector.get(d, ()) for d in detectors))
+        if severities:
+            matches = set().union(*(self.by_severity.get(s, ()) for s in severities))
+            selected = matches if selected is None else selected & matches
+        for tag in tags or ():
+            matches = self.by_tag.get(tag, set())
+            selected = matches if selected is None else selected & matches
+
+        if scanners:
+            positions = chain.from_iterable(
+                self.by_scanner.get(name, ()) for name in dict.fromkeys(scanners)
+            )
+            if selected is not None:
+                positions = (p for p in positions if p in selected)
+        elif selected is not None:
+            positions = sorted(selected)
+        else:
+            positions = range(len(self.entries))
+
+        return (self.entries[p] for p in positions)
+
+
+# Indexes over `_registry`, built on first query after the registry changes.
+_indexes: _RegistryIndexes | None = None
+
+# Read-only stand-in for a missing scanner or detectors entry in lookups.
+_EMPTY = MappingProxyType({})
+
 
 def set_registry_path(path: Path) -> None:
     """
     Override the default registry file path.
 
-    Useful for testing or alternative runtime environments.
+    Useful for testing or alternative runtime environments. With IN_MEMORY_PATH,
+    loading and saving become no-ops and the registry lives only in `_registry`.
     """
     global _registry_path
     _registry_path = path
 
 
+def _read_registry(path: Path) -> bytes:
+    """
+    Read the raw registry file.
+
+    Kept as a separate hook so tests can serve the registry from memory.
+    """
+    return path.read_bytes()
+
+
+def _intern_report_values(registry: dict[str, dict]) -> None:
+    """
+    Intern detector severities and tags in place.
+
+    The same handful of severity and tag strings repeat across every detector;
+    interning keeps one copy of each and makes index lookups compare by identity.
+    """
+    for scanner_info in registry.values():
+        if not isinstance(scanner_info, dict):
+            continue
+        for detector_info in (scanner_info.get("detectors") or {}).values():
+            report = detector_info.get("report")
+            if not report:
+                continue
+            if isinstance(report.get("severity"), str):
+                report["severity"] = sys.intern(report["severity"])
+            if isinstance(report.get("tags"), list):
+                report["tags"] = [
+                    sys.intern(tag) if isinstance(tag, str) else tag
+                    for tag in report["tags"]
+                ]
+
+
 def _load_registry() -> None:
     """
     Load the scanner registry from disk into memory.
@@ -39,16 +174,20 @@ def _load_registry() -> None:
     If the registry file does not exist or is invalid, an empty registry is loaded.
     """
     global _registry
+    if _registry_path == IN_MEMORY_PATH:
+        return
+
     if not _registry_path.exists():
         _logger.debug(f"Scanner registry not found: {_registry_path}")
         _registry = {}
         return
 
     try:
-        with open(_registry_path, "r") as f:
-            _registry = json.load(f)
-            _logger.debug(f"Loaded registry with {len(_registry)} scanners")
-    except (json.JSONDecodeError, IOError) as e:
+        _registry = loads(_read_registry(_registry_path))
+        _intern_report_values(_registry)
+        _logger.debug(f"Loaded registry with {len(_registry)} scanners")
+    except (ValueError, IOError) as e:
+        # Invalid JSON raises a ValueError subclass with either parser
         _logger.error(f"Failed to read scanner registry: {e}")
         _registry = {}
 
@@ -70,19 +209,71 @@ def has_scanner(scanner_name: str) -> bool:
     return scanner_name in _registry
 
 
+def _save_registry() -> None:
+    """
+    Write the in-memory registry to disk, or defer it inside a bulk_update() block.
+
+    The file is replaced atomically, so a failed save leaves the previous file
+    intact. Raises OSError if the registry cannot be written.
+    """
+    global _pending_save
+    if _bulk_depth:
+        _pending_save = True
+        return
+    if _registry_path == IN_MEMORY_PATH:
+        _pending_save = False
+        return
+
+    _registry_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = _registry_path.with_name(_registry_path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(dumps(_registry, indent=True))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, _registry_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    _pending_save = False
+
+
+@contextmanager
+def bulk_update() -> Iterator[None]:
+    """
+    Defer saving the registry to disk until the block exits.
+
+    Scanners added or removed inside the block are saved with a single write
+    when the outermost block exits, even if it exits with an exception.
+    Reloading the registry inside the block discards the unsaved changes.
+    """
+    global _bulk_depth
+    _bulk_depth += 1
+    try:
+        yield
+    finally:
+        _bulk_depth -= 1
+        if not _bulk_depth and _pending_save:
+            try:
+                _save_registry()
+            except OSError as e:
+                _logger.error(f"Failed to save updated registry: {e}")
+                raise
+
+
 def add_or_update_scanner(scanner_name: str, scanner_entry: dict) -> None:
     """
     Add a new scanner or update an existing scanner in the registry.
 
-    Immediately persists the change to disk.
+    Immediately persists the change to disk, unless inside bulk_update().
     """
+    global _indexes
     _logger.debug(f"Adding/updating scanner '{scanner_name}' in registry")
     _registry[scanner_name] = scanner_entry
+    _indexes = None
 
     try:
-        _registry_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(_registry_path, "w") as f:
-            json.dump(_registry, f, indent=2)
+        _save_registry()
         _logger.info(f"Scanner '{scanner_name}' successfully added/updated")
     except IOError as e:
         _logger.error(f"Failed to save updated registry: {e}")
@@ -94,23 +285,34 @@ def remove_scanner(scanner_name: str) -> None:
     Remove a scanner from the registry by name.
 
     No error is raised if the scanner does not exist.
-    Immediately persists the change to disk.
+    Immediately persists the change to disk, unless inside bulk_update().
     """
+    global _indexes
     if scanner_name not in _registry:
         _logger.debug(f"Scanner '{scanner_name}' not found. Nothing to remove.")
         return
 
     del _registry[scanner_name]
+    _indexes = None
     _logger.debug(f"Removed scanner '{scanner_name}'")
 
     try:
-        with open(_registry_path, "w") as f:
-            json.dump(_registry, f, indent=2)
+        _save_registry()
         _logger.debug(f"Saved updated registry to {_registry_path}")
     except IOError as e:
         _logger.error(f"Failed to save updated scanner registry: {e}")
 
 
+def _get_indexes() -> _RegistryIndexes:
+    """
+    Return the indexes for the current registry, rebuilding them if it was replaced.
+    """
+    global _indexes
+    if _indexes is None or _indexes.registry is not _registry:
+        _indexes = _RegistryIndexes.build(_registry)
+    return _indexes
+
+
 def get_installed_scanner_names() -> list[str]:
     """
     Return a list of all installed scanner names.
@@ -144,11 +346,8 @@ def get_scanner_detector_info(scanner_name: str, detector_name: str) -> dict | N
 
     Returns None if either the scanner or detector is not found.
     """
-    scanner_info = _registry.get(scanner_name)
-    if not scanner_info or "detectors" not in scanner_info:
-        return None
-
-    return scanner_info["detectors"].get(detector_name)
+    scanner_info = _registry.get(scanner_name) or _EMPTY
+    return (scanner_info.get("detectors") or _EMPTY).get(detector_name)
 
 
 def get_all_detector_names() -> list[str]:
@@ -189,43 +388,30 @@ def get_tags_by_criteria(
 
     Returns a sorted list of tag metadata.
     """
-    scanner_names = scanners if scanners else get_installed_scanner_names()
-    valid_scanner_names = [name for name in scanner_names if name in _registry]
-
     tag_info = {}
 
-    for scanner_name in valid_scanner_names:
-        scanner_info = _registry[scanner_name]
-        if "detectors" not in scanner_info or not scanner_info["detectors"]:
+    entries = _get_indexes().select(scanners=scanners, severities=severities)
+    for scanner_name, detector_name, detector_info in entries:
+        if "report" not in detector_info:
             continue
 
-        for detector_name, detector_info in scanner_info["detectors"].items():
-            if "report" not in detector_info:
-                continue
-
-            if severities and (
-                "severity" not in detector_info["report"]
-                or detector_info["report"]["severity"] not in severities
-            ):
-                continue
-
-            for tag in detector_info["report"].get("tags", []):
-                if tag not in tag_info:
-                    tag_info[tag] = {
-                        "name": tag,
-                        "detectors": [],
-                        "scanners": [],
-                        "detector_count": 0,
-                        "scanner_count": 0,
-                    }
+        for tag in detector_info["report"].get("tags", []):
+            if tag not in tag_info:
+                tag_info[tag] = {
+                    "name": tag,
+                    "detectors": [],
+                    "scanners": [],
+                    "detector_count": 0,
+                    "scanner_count": 0,
+                }
 
-                if detector_name not in tag_info[tag]["detectors"]:
-                    tag_info[tag]["detectors"].append(detector_name)
-                    tag_info[tag]["detector_count"] += 1
+            if detector_name not in tag_info[tag]["detectors"]:
+                tag_info[tag]["detectors"].append(detector_name)
+                tag_info[tag]["detector_count"] += 1
 
-                if scanner_name not in tag_info[tag]["scanners"]:
-                    tag_info[tag]["scanners"].append(scanner_name)
-                    tag_info[tag]["scanner_count"] += 1
+            if scanner_name not in tag_info[tag]["scanners"]:
+                tag_info[tag]["scanners"].append(scanner_name)
+                tag_info[tag]["scanner_count"] += 1
 
     return sorted(tag_info.values(), key=lambda x: x["name"])
 
@@ -237,26 +423,16 @@ def get_severities_by_criteria(
     """
     Retrieve severities mapped to detector names, optionally filtered by scanners and tags.
     """
-    scanner_names = scanners if scanners else get_installed_scanner_names()
-    valid_scanner_names = [name for name in scanner_names if name in _registry]
-
     severity_map = {}
 
-    for scanner_name in valid_scanner_names:
-        scanner_info = _registry[scanner_name]
-        if "detectors" not in scanner_info or not scanner_info["detectors"]:
+    for _, detector_name, detector_info in _get_indexes().select(
+        scanners=scanners, tags=tags
+    ):
+        if "report" not in detector_info:
             continue
 
-        for detector_name, detector_info in scanner_info["detectors"].items():
-            if "report" not in detector_info:
-                continue
-
-            detector_tags = set(detector_info["report"].get("tags", []))
-            if tags and not all(tag in detector_tags for tag in tags):
-                continue
-
-            severity = detector_info["report"].get("severity", "unknown")
-            severity_map.setdefault(severity, []).append(detector_name)
+        severity = detector_info["report"].get("severity", "unknown")
+        severity_map.setdefault(severity, []).append(detector_name)
 
     for severity in severity_map:
         severity_map[severity].sort()
@@ -274,50 +450,20 @@ def get_detectors_by_criteria(
 
     Returns a sorted list of detector metadata.
     """
-    scanner_names = scanners if scanners else get_installed_scanner_names()
-    valid_scanner_names = [name for name in scanner_names if name in _registry]
-
     matching_detectors = {}
 
-    for scanner_name in valid_scanner_names:
-        scanner_info = _registry[scanner_name]
-        if "detectors" not in scanner_info or not scanner_info["detectors"]:
+    entries = _get_indexes().select(scanners=scanners, severities=severities, tags=tags)
+    for scanner_name, detector_name, detector_info in entries:
+        if detector_name in matching_detectors:
             continue
 
-        for detector_name, detector_info in scanner_info["detectors"].items():
-            if detector_name in matching_detectors:
-                continue
-
-            matches = True
-
-            if severities and (
-                "report" not in detector_info
-                or "severity" not in detector_info["report"]
-                or detector_info["report"]["severity"] not in severities
-            ):
-                matches = False
-                continue
-
-            if tags and (
-                "report" not in detector_info
-                or "tags" not in detector_info["report"]
-                or not all(tag in detector_info["report"]["tags"] for tag in tags)
-            ):
-                matches = False
-                continue
-
-            if matches:
-                matching_detectors[detector_name] = {
-                    "name": detector_name,
-                    "description": detector_info.get(
-                        "description", "No description available"
-                    ),
-                    "severity": detector_info.get("report", {}).get(
-                        "severity", "unknown"
-                    ),
-                    "tags": detector_info.get("report", {}).get("tags", []),
-                    "scanner": scanner_name,
-                }
+        matching_detectors[detector_name] = {
+            "name": detector_name,
+            "description": detector_info.get("description", "No description available"),
+            "severity": detector_info.get("report", {}).get("severity", "unknown"),
+            "tags": detector_info.get("report", {}).get("tags", []),
+            "scanner": scanner_name,
+        }
 
     return sorted(matching_detectors.values(), key=lambda x: x["name"])
 
@@ -332,31 +478,19 @@ def get_scanners_by_criteria(
 
     Returns a sorted list of matching scanner metadata.
     """
-    matching_scanners = []
+    matching_scanners = {}
 
-    for scanner_name, scanner_info in _registry.items():
-        if "detectors" not in scanner_info or not scanner_info["detectors"]:
-            continue
+    entries = _get_indexes().select(
+        detectors=detectors, tags=tags, severities=severities
+    )
+    for scanner_name, _, _ in entries:
+        if scanner_name not in matching_scanners:
+            matching_scanners[scanner_name] = {
+                **_registry[scanner_name],
+                "name": scanner_name,
+            }
 
-        for detector_name, detector_info in scanner_info["detectors"].items():
-            report = detector_info.get("report", {})
-
-            if detectors and detector_name not in detectors:
-                continue
-
-            if tags:
-                detector_tags = set(report.get("tags", []))
-                if not all(tag in detector_tags for tag in tags):
-                    continue
-
-            if severities:
-                if report.get("severity") not in severities:
-                    continue
-
-            matching_scanners.append({**scanner_info, "name": scanner_name})
-            break
-
-    return sorted(matching_scanners, key=lambda x: x["name"])
+    return sorted(matching_scanners.values(), key=lambda x: x["name"])
 
 
 def get_scanner_full_detector_metadata(scanner_name: str) -> dict:
@@ -365,10 +499,7 @@ def get_scanner_full_detector_metadata(scanner_name: str) -> dict:
 
     If the scanner or its detectors are not found, returns an empty dictionary.
     """
-    scanner_info = _registry.get(scanner_name)
-    if not scanner_info or "detectors" not in scanner_info:
-        return {}
-    return scanner_info["detectors"]
+    return (_registry.get(scanner_name) or _EMPTY).get("detectors", {})
 
 
 def get_scanner_version(scanner_name: str) -> str | None:
@@ -377,10 +508,7 @@ def get_scanner_version(scanner_name: str) -> str | None:
 
     Returns None if the scanner is not found or version is not available.
     """
-    scanner_info = _registry.get(scanner_name)
-    if not scanner_info:
-        return None
-    return scanner_info.get("version")
+    return (_registry.get(scanner_name) or _EMPTY).get("version")
 
 
 def get_scanner_org(scanner_name: str) -> str | None:
@@ -389,10 +517,7 @@ def get_scanner_org(scanner_name: str) -> str | None:
 
     Returns None if the scanner is not found or organization is not available.
     """
-    scanner_info = _registry.get(scanner_name)
-    if not scanner_info:
-        return None
-    return scanner_info.get("org")
+    return (_registry.get(scanner_name) or _EMPTY).get("org")
 
 
 def get_scanner_description(scanner_name: str) -> str | None:
@@ -401,10 +526,7 @@ def get_scanner_description(scanner_name: str) -> str | None:
 
     Returns None if the scanner is not found or description is not available.
     """
-    scanner_info = _registry.get(scanner_name)
-    if not scanner_info:
-        return None
-    return scanner_info.get("description")
+    return (_registry.get(scanner_name) or _EMPTY).get("description")
 
 
 def get_scanner_detector_names(scanner_name: str) -> list[str]:
@@ -413,10 +535,14 @@ def get_scanner_detector_names(scanner_name: str) -> list[str]:
 
     Returns an empty list if the scanner is not found or has no detectors.
     """
-    scanner_info = _registry.get(scanner_name)
-    if not scanner_info or "detectors" not in scanner_info:
-        return []
-    return sorted(scanner_info["detectors"].keys())
+    indexes = _get_indexes()
+    try:
+        detector_names = indexes.detector_names[scanner_name]
+    except KeyError:
+        detector_names = indexes.detector_names[scanner_name] = tuple(
+            sorted((_registry.get(scanner_name) or _EMPTY).get("detectors", _EMPTY))
+        )
+    return list(detector_names)
 
 
 # Load registry immediately on module import.
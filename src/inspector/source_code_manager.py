@@ -52,6 +52,32 @@ class SourceCodeManager:
         column_number = offset - line_offsets[line_idx] + 1  # 1-based
         return line_number, column_number
 
+    def offsets_to_line_cols(
+        self, path: Path, offsets: list[int]
+    ) -> list[tuple[int, int]]:
+        """
+        Convert many offsets in the same file to (line, col) in one pass.
+
+        Args:
+            path: Path to the file.
+            offsets: Character offsets from start of file.
+
+        Returns:
+            A list of (line_number, column_number) pairs, both 1-indexed,
+            in the same order as `offsets`.
+        """
+        if path not in self._file_contents:
+            self.load_file(path)
+
+        line_offsets = self._file_line_offsets[path]
+        bisect_right = bisect.bisect_right
+
+        positions = []
+        for offset in offsets:
+            line_idx = bisect_right(line_offsets, offset) - 1
+            positions.append((line_idx + 1, offset - line_offsets[line_idx] + 1))
+        return positions
+
     def get_text_range(
         self, path: Path, offset_start: int, offset_end: int
     ) -> list[str]:
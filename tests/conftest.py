@@ -0,0 +1,60 @@
+import logging
+import os
+from pathlib import Path
+
+import pytest
+
+from inspector.cli.capabilities import install, uninstall
+from inspector.constants import PATH_PROJECT_ROOT
+from inspector.scanner_manager import ScannerManager
+
+try:
+    import coverage
+except ImportError:
+    coverage = None
+
+logger = logging.getLogger(__name__)
+
+MOCK_SCANNER_PATH = "tests/utils/mock_scanner"
+TESTS_DIR = Path(__file__).parent
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cli_subprocess_coverage():
+    """
+    Measure CLI subprocesses only when the suite itself runs under coverage.
+
+    The tests spawn the CLI with plain `python`; when coverage is active this puts
+    tests/sitecustomize.py on PYTHONPATH and points COVERAGE_PROCESS_START at the
+    project's .coveragerc so each subprocess starts coverage itself.
+    """
+    if coverage is None or coverage.Coverage.current() is None:
+        yield
+        return
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("COVERAGE_PROCESS_START", str(PATH_PROJECT_ROOT / ".coveragerc"))
+        mp.setenv("PYTHONPATH", str(TESTS_DIR), prepend=os.pathsep)
+        yield
+
+
+@pytest.fixture(scope="session")
+def mock_scanner():
+    """Install the mock scanner once for the whole session and uninstall it at the end."""
+    # Call the install capability in-process rather than spawning the CLI
+    install("scanner", "local_path", MOCK_SCANNER_PATH, reinstall=True, develop=True)
+    logger.debug("Setup completed, successfully installed mock scanner.")
+
+    # Load just the newly installed scanner instead of reloading every scanner
+    ScannerManager.add_installed("mock-scanner")
+
+    yield "mock-scanner"
+
+    uninstall("scanner", "mock-scanner")
+    ScannerManager.reload()
+
+
+@pytest.fixture(scope="session")
+def scanner_manager(mock_scanner):
+    """The ScannerManager loaded with the mock scanner, shared by the session."""
+    return ScannerManager()
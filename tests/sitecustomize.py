@@ -0,0 +1,9 @@
+"""
+Start coverage in the CLI subprocesses spawned by the tests.
+
+Only on PYTHONPATH when conftest.py finds the suite running under coverage.
+"""
+
+import coverage
+
+coverage.process_startup()
@@ -1,12 +1,18 @@
 import unittest
 import os
 import subprocess
+import sys
 import shutil
 import logging
 from logging import Logger
 
+import pytest
+
 logger: Logger = logging.getLogger(__name__)
 
+# Installs the mock scanner, so it shares a pytest-xdist worker with the other installers
+pytestmark = pytest.mark.xdist_group("scanner_install")
+
 DEFAULT_CODEBASE_TEST_FOLDER = "./tests/utils/files"
 MOCK_SCANNER_PATH = "./tests/utils/mock_scanner"
 SCOPE_FILE = "test.scope"
@@ -24,9 +30,8 @@ class TestArgumentHandler(unittest.TestCase):
         shutil.copytree(cls.folder_path, cls.test_dir)
 
         # Install mock_scanner
-        coverage_command = [
-            "coverage",
-            "run",
+        cli_command = [
+            sys.executable,
             "-m",
             "src.inspector_cli",
             "scanner",
@@ -36,7 +41,7 @@ class TestArgumentHandler(unittest.TestCase):
             "--dev",
         ]
         result = subprocess.run(
-            coverage_command,
+            cli_command,
             capture_output=True,
             text=True,
         )
@@ -56,9 +61,8 @@ class TestArgumentHandler(unittest.TestCase):
             os.rmdir(cls.test_dir)
 
         # Uninstall mock-scanner
-        coverage_command = [
-            "coverage",
-            "run",
+        cli_command = [
+            sys.executable,
             "-m",
             "src.inspector_cli",
             "scanner",
@@ -66,7 +70,7 @@ class TestArgumentHandler(unittest.TestCase):
             "mock-scanner",
         ]
         result = subprocess.run(
-            coverage_command,
+            cli_command,
             capture_output=True,
             text=True,
         )
@@ -80,8 +84,7 @@ class TestArgumentHandler(unittest.TestCase):
 
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scan",
@@ -89,7 +92,8 @@ class TestArgumentHandler(unittest.TestCase):
                 "--scope",
                 self.scope_file,
             ],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
         )
         self.assertEqual(result.returncode, 1)
@@ -105,8 +109,7 @@ class TestArgumentHandler(unittest.TestCase):
 
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scan",
@@ -140,8 +143,7 @@ class TestArgumentHandler(unittest.TestCase):
 
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scan",
@@ -167,8 +169,7 @@ class TestArgumentHandler(unittest.TestCase):
 
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scan",
@@ -180,7 +181,8 @@ class TestArgumentHandler(unittest.TestCase):
                 "--scope",
                 self.scope_file,
             ],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
         )
         self.assertEqual(result.returncode, 1)
@@ -199,8 +201,7 @@ class TestArgumentHandler(unittest.TestCase):
 
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scan",
@@ -239,8 +240,7 @@ class TestArgumentHandler(unittest.TestCase):
 
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scan",
@@ -282,8 +282,7 @@ class TestArgumentHandler(unittest.TestCase):
 
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scan",
@@ -311,8 +310,7 @@ class TestArgumentHandler(unittest.TestCase):
 
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scan",
@@ -339,8 +337,7 @@ class TestArgumentHandler(unittest.TestCase):
 
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scan",
@@ -352,7 +349,8 @@ class TestArgumentHandler(unittest.TestCase):
                 "--scope",
                 self.scope_file,
             ],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
         )
         self.assertEqual(result.returncode, 1)
@@ -367,8 +365,7 @@ class TestArgumentHandler(unittest.TestCase):
 
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scan",
@@ -396,8 +393,7 @@ class TestArgumentHandler(unittest.TestCase):
 
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scan",
@@ -425,8 +421,7 @@ class TestArgumentHandler(unittest.TestCase):
 
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scan",
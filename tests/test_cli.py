@@ -3,6 +3,7 @@ import shutil
 import unittest
 import argparse
 import subprocess
+import sys
 from inspector import __version__
 from inspector.cli.capabilities.auto_completion import is_auto_completion_installed
 from inspector.constants import PATH_PROJECT_ROOT
@@ -10,8 +11,14 @@ import json
 import logging
 from logging import Logger
 
+import pytest
+
 logger: Logger = logging.getLogger(__name__)
 
+# These tests install scanners into the user's inspector directory, so under
+# pytest-xdist (--dist loadgroup) they share one worker with the other installers
+pytestmark = pytest.mark.xdist_group("scanner_install")
+
 
 DEFAULT_CODEBASE_TEST_FOLDER = PATH_PROJECT_ROOT / "tests/utils/files"
 MOCK_SCANNER_PATH = PATH_PROJECT_ROOT / "tests/utils/mock_scanner"
@@ -29,9 +36,6 @@ class TestCLI(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Ensure the provided folder exists and contains Solidity files."""
-        os.environ["COVERAGE_PROCESS_START"] = ".coveragerc"
-        os.environ["COVERAGE_FILE"] = ".coverage"
-
         if not cls.folder_path:
             raise ValueError("Folder path must be provided via arguments.")
         if not os.path.exists(cls.folder_path):
@@ -42,9 +46,8 @@ class TestCLI(unittest.TestCase):
         shutil.copytree(cls.folder_path, cls.test_dir)
 
         # Install mock_scanner
-        coverage_command = [
-            "coverage",
-            "run",
+        cli_command = [
+            sys.executable,
             "-m",
             "src.inspector_cli",
             "scanner",
@@ -54,7 +57,7 @@ class TestCLI(unittest.TestCase):
             "--dev",
         ]
         result = subprocess.run(
-            coverage_command,
+            cli_command,
             capture_output=True,
             text=True,
         )
@@ -79,9 +82,8 @@ class TestCLI(unittest.TestCase):
         os.rmdir(cls.test_dir)
 
         # Uninstall mock_scanner
-        coverage_command = [
-            "coverage",
-            "run",
+        cli_command = [
+            sys.executable,
             "-m",
             "src.inspector_cli",
             "scanner",
@@ -89,7 +91,7 @@ class TestCLI(unittest.TestCase):
             "mock-scanner",
         ]
         result = subprocess.run(
-            coverage_command,
+            cli_command,
             capture_output=True,
             text=True,
         )
@@ -98,7 +100,7 @@ class TestCLI(unittest.TestCase):
 
     def install_autocomplete(self):
         result = subprocess.run(
-            ["coverage", "run", "-m", "src.inspector_cli", "autocomplete", "install"],
+            [sys.executable, "-m", "src.inspector_cli", "autocomplete", "install"],
             capture_output=True,
             text=True,
         )
@@ -119,8 +121,7 @@ class TestCLI(unittest.TestCase):
         try:
             result = subprocess.run(
                 [
-                    "coverage",
-                    "run",
+                    sys.executable,
                     "-m",
                     "src.inspector_cli",
                     "autocomplete",
@@ -140,8 +141,7 @@ class TestCLI(unittest.TestCase):
 
             uninstall_result = subprocess.run(
                 [
-                    "coverage",
-                    "run",
+                    sys.executable,
                     "-m",
                     "src.inspector_cli",
                     "autocomplete",
@@ -164,15 +164,14 @@ class TestCLI(unittest.TestCase):
             elif not initial_state and is_auto_completion_installed():
                 subprocess.run(
                     [
-                        "coverage",
-                        "run",
+                        sys.executable,
                         "-m",
                         "src.inspector_cli",
                         "autocomplete",
                         "uninstall",
                     ],
-                    capture_output=True,
-                    text=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                 )
 
     @unittest.skipIf(
@@ -186,22 +185,20 @@ class TestCLI(unittest.TestCase):
                 # Uninstall autocomplete if it is installed
                 result = subprocess.run(
                     [
-                        "coverage",
-                        "run",
+                        sys.executable,
                         "-m",
                         "src.inspector_cli",
                         "autocomplete",
                         "uninstall",
                     ],
-                    capture_output=True,
-                    text=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                 )
 
             # The uninstall command should fail if it is not installed
             result = subprocess.run(
                 [
-                    "coverage",
-                    "run",
+                    sys.executable,
                     "-m",
                     "src.inspector_cli",
                     "autocomplete",
@@ -225,8 +222,7 @@ class TestCLI(unittest.TestCase):
         """Test the 'scan' command with a valid project directory."""
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scan",
@@ -249,8 +245,7 @@ class TestCLI(unittest.TestCase):
         """Test the 'scan' command with a valid project directory."""
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scan",
@@ -278,8 +273,7 @@ class TestCLI(unittest.TestCase):
         """Test the 'scan' command with a valid project directory."""
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scan",
@@ -320,8 +314,7 @@ class TestCLI(unittest.TestCase):
 
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scan",
@@ -347,8 +340,7 @@ class TestCLI(unittest.TestCase):
 
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scan",
@@ -372,8 +364,7 @@ class TestCLI(unittest.TestCase):
 
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scan",
@@ -396,8 +387,7 @@ class TestCLI(unittest.TestCase):
         file_path = f"{self.test_dir}/TestContract.sol"
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scan",
@@ -409,7 +399,8 @@ class TestCLI(unittest.TestCase):
                 "--detector",
                 "mock-test",
             ],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
         )
         self.assertEqual(result.returncode, 2)
@@ -419,7 +410,7 @@ class TestCLI(unittest.TestCase):
         """Test the 'version' command to check if the version is returned correctly."""
 
         result = subprocess.run(
-            ["coverage", "run", "-m", "src.inspector_cli", "version"],
+            [sys.executable, "-m", "src.inspector_cli", "version"],
             capture_output=True,
             text=True,
         )
@@ -433,8 +424,7 @@ class TestCLI(unittest.TestCase):
         scanner_name = "mock-scanner"
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scanner",
@@ -450,8 +440,7 @@ class TestCLI(unittest.TestCase):
         """Test the 'test' command with a valid option."""
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "test",
@@ -471,8 +460,7 @@ class TestCLI(unittest.TestCase):
         """Test the 'test' command with --table option."""
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "test",
@@ -493,7 +481,7 @@ class TestCLI(unittest.TestCase):
     def test_scanner_command_no_action(self):
         """Test scanner command without action."""
         result = subprocess.run(
-            ["coverage", "run", "-m", "src.inspector_cli", "scanner"],
+            [sys.executable, "-m", "src.inspector_cli", "scanner"],
             capture_output=True,
             text=True,
         )
@@ -503,7 +491,7 @@ class TestCLI(unittest.TestCase):
     def test_autocomplete_command_no_action(self):
         """Test autocomplete command without action."""
         result = subprocess.run(
-            ["coverage", "run", "-m", "src.inspector_cli", "autocomplete"],
+            [sys.executable, "-m", "src.inspector_cli", "autocomplete"],
             capture_output=True,
             text=True,
         )
@@ -515,8 +503,7 @@ class TestCLI(unittest.TestCase):
         output_file = "test_output"
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scan",
@@ -528,8 +515,8 @@ class TestCLI(unittest.TestCase):
                 "--detector",
                 "mock-test",
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
         )
         self.assertEqual(result.returncode, 0)
         self.assertTrue(os.path.exists(f"{output_file}.md"))
@@ -539,8 +526,7 @@ class TestCLI(unittest.TestCase):
         """Test scan command with JSON output format."""
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scan",
@@ -577,8 +563,7 @@ class TestCLI(unittest.TestCase):
         """Test scan command with quiet mode."""
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scan",
@@ -599,8 +584,7 @@ class TestCLI(unittest.TestCase):
         """Test scan command with minimal output."""
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scan",
@@ -627,8 +611,7 @@ class TestCLI(unittest.TestCase):
 
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scan",
@@ -636,7 +619,8 @@ class TestCLI(unittest.TestCase):
                 "--output-file",
                 f"{read_only_dir}/test",
             ],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
         )
         self.assertEqual(result.returncode, 1)
@@ -668,8 +652,7 @@ class TestCLI(unittest.TestCase):
         # Test with leave annotations
         result_with = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "test",
@@ -685,8 +668,7 @@ class TestCLI(unittest.TestCase):
         # Test without leave annotations
         result_without = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "test",
@@ -723,9 +705,8 @@ class TestMockScannerInstallationCommands(unittest.TestCase):
             )
 
         logger.debug("Checking if mock-scanner is installed...")
-        coverage_command = [
-            "coverage",
-            "run",
+        cli_command = [
+            sys.executable,
             "-m",
             "src.inspector_cli",
             "scanner",
@@ -733,15 +714,14 @@ class TestMockScannerInstallationCommands(unittest.TestCase):
         ]
 
         result = subprocess.run(
-            coverage_command,
+            cli_command,
             capture_output=True,
             text=True,
         )
         if "mock-scanner" in result.stdout:
             logger.debug("mock-scanner is installed, uninstalling...")
-            coverage_command = [
-                "coverage",
-                "run",
+            cli_command = [
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scanner",
@@ -750,7 +730,7 @@ class TestMockScannerInstallationCommands(unittest.TestCase):
             ]
 
             result = subprocess.run(
-                coverage_command,
+                cli_command,
                 capture_output=True,
                 text=True,
             )
@@ -762,9 +742,8 @@ class TestMockScannerInstallationCommands(unittest.TestCase):
     def tearDownClass(cls):
         """Clean up test directories and files."""
         logger.debug("Tearing down test environment...")
-        coverage_command = [
-            "coverage",
-            "run",
+        cli_command = [
+            sys.executable,
             "-m",
             "src.inspector_cli",
             "scanner",
@@ -772,15 +751,14 @@ class TestMockScannerInstallationCommands(unittest.TestCase):
         ]
 
         result = subprocess.run(
-            coverage_command,
+            cli_command,
             capture_output=True,
             text=True,
         )
         if "mock-scanner" in result.stdout:
             logger.debug("mock-scanner is installed, uninstalling...")
-            coverage_command = [
-                "coverage",
-                "run",
+            cli_command = [
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scanner",
@@ -789,9 +767,9 @@ class TestMockScannerInstallationCommands(unittest.TestCase):
             ]
 
             result = subprocess.run(
-                coverage_command,
-                capture_output=True,
-                text=True,
+                cli_command,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
             )
         pass
 
@@ -801,9 +779,8 @@ class TestMockScannerInstallationCommands(unittest.TestCase):
         logger.debug(f"Mock scanner path exists: {os.path.exists(MOCK_SCANNER_PATH)}")
         logger.debug(f"Project root: {PATH_PROJECT_ROOT}")
 
-        coverage_command = [
-            "coverage",
-            "run",
+        cli_command = [
+            sys.executable,
             "-m",
             "src.inspector_cli",
             "scanner",
@@ -812,7 +789,7 @@ class TestMockScannerInstallationCommands(unittest.TestCase):
             "--dev",
         ]
         result = subprocess.run(
-            coverage_command,
+            cli_command,
             capture_output=True,
             text=True,
         )
@@ -828,9 +805,8 @@ class TestMockScannerInstallationCommands(unittest.TestCase):
     def test_scanner_uninstall_command(self):
         """Test the 'scanner uninstall' command with a valid option."""
         # Install mock-scanner if it is not installed
-        coverage_command = [
-            "coverage",
-            "run",
+        cli_command = [
+            sys.executable,
             "-m",
             "src.inspector_cli",
             "scanner",
@@ -838,15 +814,14 @@ class TestMockScannerInstallationCommands(unittest.TestCase):
         ]
 
         result = subprocess.run(
-            coverage_command,
+            cli_command,
             capture_output=True,
             text=True,
         )
         if "mock-scanner" not in result.stdout:
             self.test_scanner_install_command()
-        coverage_command = [
-            "coverage",
-            "run",
+        cli_command = [
+            sys.executable,
             "-m",
             "src.inspector_cli",
             "scanner",
@@ -854,7 +829,7 @@ class TestMockScannerInstallationCommands(unittest.TestCase):
             "mock-scanner",
         ]
         result = subprocess.run(
-            coverage_command,
+            cli_command,
             capture_output=True,
             text=True,
         )
@@ -862,12 +837,51 @@ class TestMockScannerInstallationCommands(unittest.TestCase):
         self.assertEqual(result.returncode, 0)
         self.assertIn("Uninstalled scanner successfully:", result.stdout)
 
+    def test_scanner_install_and_uninstall_multiple_targets(self):
+        """Test installing and uninstalling several scanners in one invocation."""
+        cli_command = [
+            sys.executable,
+            "-m",
+            "src.inspector_cli",
+            "scanner",
+            "install",
+            MOCK_SCANNER_PATH,
+            MOCK_EXECUTABLE_SCANNER_PATH,
+            "--reinstall",
+            "--dev",
+        ]
+        result = subprocess.run(
+            cli_command,
+            capture_output=True,
+            text=True,
+        )
+
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout.count("Installed scanner successfully:"), 2)
+
+        cli_command = [
+            sys.executable,
+            "-m",
+            "src.inspector_cli",
+            "scanner",
+            "uninstall",
+            "mock-scanner",
+            "mock-executable-scanner",
+        ]
+        result = subprocess.run(
+            cli_command,
+            capture_output=True,
+            text=True,
+        )
+
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout.count("Uninstalled scanner successfully:"), 2)
+
     def test_scanner_install_zip_command(self):
         """Test the 'scanner install' command with a zip file."""
         # Uninstall mock-scanner if it is installed
-        coverage_command = [
-            "coverage",
-            "run",
+        cli_command = [
+            sys.executable,
             "-m",
             "src.inspector_cli",
             "scanner",
@@ -875,15 +889,14 @@ class TestMockScannerInstallationCommands(unittest.TestCase):
         ]
 
         result = subprocess.run(
-            coverage_command,
+            cli_command,
             capture_output=True,
             text=True,
         )
         if "mock-scanner" in result.stdout:
             self.test_scanner_uninstall_command()
-        coverage_command = [
-            "coverage",
-            "run",
+        cli_command = [
+            sys.executable,
             "-m",
             "src.inspector_cli",
             "scanner",
@@ -894,7 +907,7 @@ class TestMockScannerInstallationCommands(unittest.TestCase):
             "warn",
         ]
         result = subprocess.run(
-            coverage_command,
+            cli_command,
             capture_output=True,
             text=True,
         )
@@ -908,15 +921,15 @@ class TestMockScannerInstallationCommands(unittest.TestCase):
         non_existent_scanner_path = "/tmp/non_existent_inspector_scanner"
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scanner",
                 "install",
                 non_existent_scanner_path,
             ],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
         )
         self.assertEqual(result.returncode, 2)
@@ -930,15 +943,15 @@ class TestMockScannerInstallationCommands(unittest.TestCase):
         # Try to uninstall a non-existent scanner
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scanner",
                 "uninstall",
                 scanner_name,
             ],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
         )
         self.assertEqual(result.returncode, 2)
@@ -956,8 +969,7 @@ class TestMockScannerInstallationCommands(unittest.TestCase):
         # Try to install scanner
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scanner",
@@ -981,8 +993,7 @@ class TestMockScannerInstallationCommands(unittest.TestCase):
         """Test scanner installation from an invalid remote zip URL."""
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scanner",
@@ -1008,8 +1019,7 @@ class TestMockScannerInstallationCommands(unittest.TestCase):
 
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scanner",
@@ -1056,8 +1066,7 @@ class TestMockScannerInstallationCommands(unittest.TestCase):
 
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scanner",
@@ -1067,7 +1076,8 @@ class TestMockScannerInstallationCommands(unittest.TestCase):
                 "--log-level",
                 "warn",
             ],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
         )
 
@@ -1101,9 +1111,8 @@ class TestExecutableScanner(unittest.TestCase):
             )
 
         logger.debug("Checking if mock-executable-scanner is installed...")
-        coverage_command = [
-            "coverage",
-            "run",
+        cli_command = [
+            sys.executable,
             "-m",
             "src.inspector_cli",
             "scanner",
@@ -1111,15 +1120,14 @@ class TestExecutableScanner(unittest.TestCase):
         ]
 
         result = subprocess.run(
-            coverage_command,
+            cli_command,
             capture_output=True,
             text=True,
         )
         if "mock-executable-scanner" in result.stdout:
             logger.debug("mock-executable-scanner is installed, uninstalling...")
-            coverage_command = [
-                "coverage",
-                "run",
+            cli_command = [
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scanner",
@@ -1128,9 +1136,9 @@ class TestExecutableScanner(unittest.TestCase):
             ]
 
             uninstall_result = subprocess.run(
-                coverage_command,
-                capture_output=True,
-                text=True,
+                cli_command,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
             )
             assert uninstall_result.returncode == 0
 
@@ -1142,9 +1150,8 @@ class TestExecutableScanner(unittest.TestCase):
     def tearDownClass(cls):
         """Clean up test directories and files."""
         logger.debug("Tearing down test environment...")
-        coverage_command = [
-            "coverage",
-            "run",
+        cli_command = [
+            sys.executable,
             "-m",
             "src.inspector_cli",
             "scanner",
@@ -1152,15 +1159,14 @@ class TestExecutableScanner(unittest.TestCase):
         ]
 
         result = subprocess.run(
-            coverage_command,
+            cli_command,
             capture_output=True,
             text=True,
         )
         if "mock-executable-scanner" in result.stdout:
             logger.debug("mock-executable-scanner is installed, uninstalling...")
-            coverage_command = [
-                "coverage",
-                "run",
+            cli_command = [
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scanner",
@@ -1169,7 +1175,7 @@ class TestExecutableScanner(unittest.TestCase):
             ]
 
             result = subprocess.run(
-                coverage_command,
+                cli_command,
                 capture_output=True,
                 text=True,
             )
@@ -1189,9 +1195,8 @@ class TestExecutableScanner(unittest.TestCase):
         )
         logger.debug(f"Project root: {PATH_PROJECT_ROOT}")
 
-        coverage_command = [
-            "coverage",
-            "run",
+        cli_command = [
+            sys.executable,
             "-m",
             "src.inspector_cli",
             "scanner",
@@ -1201,7 +1206,7 @@ class TestExecutableScanner(unittest.TestCase):
             "--reinstall",
         ]
         result = subprocess.run(
-            coverage_command,
+            cli_command,
             capture_output=True,
             text=True,
         )
@@ -1222,8 +1227,7 @@ class TestExecutableScanner(unittest.TestCase):
         # Run a scan to verify detector metadata is collected correctly
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scan",
@@ -1245,17 +1249,63 @@ class TestExecutableScanner(unittest.TestCase):
         # Clean up
         subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scanner",
                 "uninstall",
                 "mock-executable-scanner",
             ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+
+    def test_executable_scanner_scan_findings(self):
+        """Test that a scan reports and composes the executable scanner's findings."""
+        self.test_executable_scanner_install()
+
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "src.inspector_cli",
+                "scan",
+                self.test_dir,
+                "--scanner",
+                "mock-executable-scanner",
+                "--output-format",
+                "json",
+                "--minimal-output",
+            ],
             capture_output=True,
             text=True,
         )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        findings = json.loads(result.stdout)["findings"]
+
+        # The mock scanner reports one finding for every file it is given
+        self.assertEqual(len(findings), len(os.listdir(self.test_dir)))
+        for finding in findings:
+            self.assertEqual(
+                finding["detector-id"], "mock-executable-scanner#mock-detector"
+            )
+            self.assertEqual(finding["severity"], "HIGH")
+            self.assertEqual(finding["tags"], ["mock", "test"])
+            self.assertEqual(finding["text"]["title"], "Mock Finding")
+
+        # Clean up
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "src.inspector_cli",
+                "scanner",
+                "uninstall",
+                "mock-executable-scanner",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
 
     def test_executable_scanner_invalid_metadata(self):
         """Test handling of invalid metadata from executable scanner."""
@@ -1282,8 +1332,7 @@ class TestExecutableScanner(unittest.TestCase):
         # Try to install the invalid scanner
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scanner",
@@ -1293,7 +1342,8 @@ class TestExecutableScanner(unittest.TestCase):
                 "--log-level",
                 "warn",
             ],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
         )
 
@@ -1329,8 +1379,7 @@ class TestExecutableScanner(unittest.TestCase):
         # Try to install the scanner
         result = subprocess.run(
             [
-                "coverage",
-                "run",
+                sys.executable,
                 "-m",
                 "src.inspector_cli",
                 "scanner",
@@ -1340,7 +1389,8 @@ class TestExecutableScanner(unittest.TestCase):
                 "--log-level",
                 "warn",
             ],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
         )
 
@@ -1,4 +1,5 @@
 import pytest
+from dataclasses import asdict
 from pathlib import Path
 from inspector.models._complete.detector_response import CompleteDetectorResponse
 from inspector.models._complete.error import Error
@@ -231,6 +232,42 @@ def test_location():
     assert location.end.offset == 20
 
 
+def test_location_path_interning():
+    # str and Path inputs normalize to the same interned string
+    from_str = Location(path="./contracts//A.sol")
+    from_path = Location(path=Path("contracts/A.sol"))
+    assert from_str.path_str == "contracts/A.sol"
+    assert from_str.path_str is from_path.path_str
+    assert from_str.path == Path("contracts/A.sol")
+    assert from_str.path is from_path.path
+    assert from_str == from_path
+
+    # __json__ emits the normalized path, as Path did
+    location = Location.from_dict(
+        {
+            "path": "./c.sol",
+            "start": {"col": 1, "line": 1, "offset": 0},
+            "end": {"col": 2, "line": 1, "offset": 1},
+        }
+    )
+    assert location.__json__()["path"] == "c.sol"
+    assert location == Location(
+        path=Path("c.sol"),
+        start=LocationPoint(col=1, line=1, offset=0),
+        end=LocationPoint(col=2, line=1, offset=1),
+    )
+
+    # Assigning the path keeps the string, JSON and equality in sync
+    location.path = Path("x.sol")
+    assert location.path_str == "x.sol"
+    assert location.path == Path("x.sol")
+    assert location.__json__()["path"] == "x.sol"
+
+    # The dataclass still exposes `path` as its field
+    assert asdict(Location(path="a.sol"))["path"] == Path("a.sol")
+    assert repr(Location(path="a.sol")).startswith("Location(path=")
+
+
 def test_location_point():
     # Test default initialization
     point = LocationPoint()
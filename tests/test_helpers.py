@@ -20,12 +20,12 @@ class TestHelpers:
         with tempfile.TemporaryDirectory() as tmpdir:
             # Create the directory structure
             root = Path(tmpdir)
-            (root / "dir1" / "dir2" / "dir3").mkdir(parents=True)
-            (root / "dir11" / "dir22" / "dir33").mkdir(parents=True)
-            (root / "dir11" / "dir22" / "dir33" / "file.ext").touch()
-
             valid_files = ["dir1/dir2/dir3", "dir11/dir22/dir33/file.ext"]
-            raw_lines = ["dir1/dir2/dir3", "dir11/dir22/dir33/file.ext"]
+            os.makedirs(root / "dir1" / "dir2" / "dir3")
+            os.makedirs(root / "dir11" / "dir22" / "dir33")
+            open(root / "dir11" / "dir22" / "dir33" / "file.ext", "x").close()
+
+            raw_lines = list(valid_files)
             valid_paths, invalid_paths = normalize_and_expand_paths(
                 raw_lines, project_root=root, label="scope", prefer_project_root=True
             )
@@ -192,8 +192,16 @@ class TestHelpers:
     def test_is_valid_scanner_directory(self):
         """Test scanner directory validation"""
         with tempfile.TemporaryDirectory() as tmpdir:
-            # pyproject.toml
             root = Path(tmpdir)
+
+            # Non-executable file only
+            (root / "README.md").touch()
+            assert not is_valid_scanner_directory(root)
+
+            # A file path is not a scanner directory
+            assert not is_valid_scanner_directory(root / "README.md")
+
+            # pyproject.toml
             (root / "pyproject.toml").touch()
             assert is_valid_scanner_directory(root)
 
@@ -291,3 +299,13 @@ class TestHelpers:
             # Test path with multiple slashes, incorrect path so it is None
             resolved = smart_resolve_path("dir1//dir2/test2.txt", root)
             assert resolved is None
+
+    def test_smart_resolve_path_sees_new_files(self):
+        """Test smart_resolve_path finds a file created after a failed lookup"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+
+            assert smart_resolve_path("late.txt", root) is None
+
+            (root / "late.txt").touch()
+            assert smart_resolve_path("late.txt", root) == (root / "late.txt").resolve()
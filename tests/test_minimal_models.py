@@ -113,6 +113,10 @@ def test_instance():
     assert json_data["offset_end"] == 20
     assert json_data["fixes"] == ["fix1", "fix2"]
     assert "extra" in json_data
+    assert list(json_data) == ["path", "offset_start", "offset_end", "fixes", "extra"]
+
+    # Instances are slotted: no per-instance __dict__
+    assert not hasattr(instance, "__dict__")
 
     # Test from_dict method
     instance_from_dict = MinimalInstance.from_dict(
@@ -163,3 +167,25 @@ def test_scanner_response():
     assert len(response_from_dict.errors) == 1
     assert response_from_dict.scanned == ["file1.py"]
     assert "detector1" in response_from_dict.responses
+
+    # Scanner output uses the same "responses" key that __json__ emits
+    response_from_dict = MinimalScannerResponse.from_dict(
+        {
+            "errors": [],
+            "scanned": ["file1.py"],
+            "responses": {
+                "detector1": {
+                    "findings": [
+                        {
+                            "instances": [
+                                {"path": "file1.py", "offset_start": 0, "offset_end": 1}
+                            ]
+                        }
+                    ],
+                    "errors": [],
+                }
+            },
+        }
+    )
+    findings = response_from_dict.responses["detector1"].findings
+    assert findings[0].instances[0].path == "file1.py"
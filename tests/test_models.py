@@ -1,28 +1,64 @@
+from dataclasses import asdict
+
 import pytest
 from inspector.models.issue_template import IssueTemplate, IssueReport
 from inspector.models.metadata_models import DetectorMetadata
 
-
-def test_issue_template_default():
-    template = IssueTemplate()
-    assert template.title == ""
-    assert template.opening == ""
-    assert template.body == ""
-    assert template.body_single_file_single_instance == ""
-    assert template.body_single_file_multiple_instance == ""
-    assert template.body_multiple_file_multiple_instance == ""
-    assert template.body_list_item_intro == ""
-    assert template.body_list_item == ""
-    assert template.body_list_item_single_file == ""
-    assert template.body_list_item_multiple_file == ""
-    assert template.closing == ""
-
-
-def test_issue_template_from_dict_empty():
-    template = IssueTemplate.from_dict({})
-    assert template.title == ""
-    assert template.opening == ""
-    assert template.body == ""
+ISSUE_TEMPLATE_DEFAULTS = [
+    ("title", ""),
+    ("opening", ""),
+    ("body", ""),
+    ("body_single_file_single_instance", ""),
+    ("body_single_file_multiple_instance", ""),
+    ("body_multiple_file_multiple_instance", ""),
+    ("body_list_item_intro", ""),
+    ("body_list_item", ""),
+    ("body_list_item_single_file", ""),
+    ("body_list_item_multiple_file", ""),
+    ("closing", ""),
+]
+
+ISSUE_REPORT_DEFAULTS = [
+    ("severity", 0),
+    ("tags", []),
+    ("template", IssueTemplate()),
+]
+
+DETECTOR_METADATA_DEFAULTS = [
+    ("id", ""),
+    ("uid", ""),
+    ("description", ""),
+    ("description_full", ""),
+    ("scanners", []),
+    ("references", []),
+    ("report", IssueReport()),
+]
+
+
+# Default objects are built once per module and only read by the tests below;
+# templates and reports built from an empty dict must match the defaults
+@pytest.fixture(scope="module", params=["default", "from_dict_empty"])
+def default_template(request):
+    if request.param == "default":
+        return IssueTemplate()
+    return IssueTemplate.from_dict({})
+
+
+@pytest.fixture(scope="module", params=["default", "from_dict_empty"])
+def default_report(request):
+    if request.param == "default":
+        return IssueReport()
+    return IssueReport.from_dict({})
+
+
+@pytest.fixture(scope="module")
+def default_metadata():
+    return DetectorMetadata()
+
+
+@pytest.mark.parametrize("attr, expected", ISSUE_TEMPLATE_DEFAULTS)
+def test_issue_template_defaults(default_template, attr, expected):
+    assert getattr(default_template, attr) == expected
 
 
 def test_issue_template_from_dict_partial():
@@ -44,18 +80,9 @@ def test_issue_template_from_dict_with_hyphenated_keys():
     assert template.body_multiple_file_multiple_instance == "Multiple Files Multiple"
 
 
-def test_issue_report_default():
-    report = IssueReport()
-    assert report.severity == 0
-    assert report.tags == []
-    assert isinstance(report.template, IssueTemplate)
-
-
-def test_issue_report_from_dict_empty():
-    report = IssueReport.from_dict({})
-    assert report.severity == 0
-    assert report.tags == []
-    assert isinstance(report.template, IssueTemplate)
+@pytest.mark.parametrize("attr, expected", ISSUE_REPORT_DEFAULTS)
+def test_issue_report_defaults(default_report, attr, expected):
+    assert getattr(default_report, attr) == expected
 
 
 def test_issue_report_from_dict_with_data():
@@ -71,15 +98,9 @@ def test_issue_report_from_dict_with_data():
     assert report.template.body == "Test Body"
 
 
-def test_detector_metadata_default():
-    metadata = DetectorMetadata()
-    assert metadata.id == ""
-    assert metadata.uid == ""
-    assert metadata.description == ""
-    assert metadata.description_full == ""
-    assert metadata.scanners == []
-    assert metadata.references == []
-    assert isinstance(metadata.report, IssueReport)
+@pytest.mark.parametrize("attr, expected", DETECTOR_METADATA_DEFAULTS)
+def test_detector_metadata_defaults(default_metadata, attr, expected):
+    assert getattr(default_metadata, attr) == expected
 
 
 def test_detector_metadata_from_dict_with_data():
@@ -97,12 +118,18 @@ def test_detector_metadata_from_dict_with_data():
         },
     }
     metadata = DetectorMetadata.from_dict(data)
-    assert metadata.id == "test-id"
-    assert metadata.uid == "test-uid"
-    assert metadata.description == "Test Description"
-    assert metadata.description_full == "Full Description"
-    assert metadata.scanners == ["scanner1", "scanner2"]
-    assert metadata.references == ["ref1", "ref2"]
-    assert metadata.report.severity == 2
-    assert metadata.report.tags == ["security"]
-    assert metadata.report.template.title == "Test Title"
+    assert asdict(metadata) == {
+        "id": "test-id",
+        "uid": "test-uid",
+        "description": "Test Description",
+        "description_full": "Full Description",
+        "scanners": ["scanner1", "scanner2"],
+        "references": ["ref1", "ref2"],
+        "report": asdict(
+            IssueReport(
+                severity=2,
+                tags=["security"],
+                template=IssueTemplate(title="Test Title"),
+            )
+        ),
+    }
@@ -0,0 +1,21 @@
+from pathlib import Path
+
+from inspector.source_code_manager import SourceCodeManager
+
+WETH9 = Path("tests/utils/files/WETH9.sol")
+
+
+def test_offsets_to_line_cols_matches_single_lookups():
+    scm = SourceCodeManager()
+    text = WETH9.read_text(encoding="utf-8")
+    offsets = [0, 1, text.index("\n"), text.index("\n") + 1, len(text) - 1, 42]
+
+    batched = scm.offsets_to_line_cols(WETH9, offsets)
+
+    assert batched == [scm.offset_to_line_col(WETH9, offset) for offset in offsets]
+    assert batched[0] == (1, 1)
+    assert batched[3] == (2, 1)
+
+
+def test_offsets_to_line_cols_empty():
+    assert SourceCodeManager().offsets_to_line_cols(WETH9, []) == []
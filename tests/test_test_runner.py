@@ -46,6 +46,7 @@ class TestTestRunner(unittest.TestCase):
         # Reset ScannerManager state
         ScannerManager._instance = None
         ScannerManager._initialized = False
+        ScannerManager._detectors_loaded = False
         ScannerManager._scanners = {}
         ScannerManager._all_detector_names = ()
         ScannerManager._all_detector_metadata = {}
@@ -60,6 +61,24 @@ class TestTestRunner(unittest.TestCase):
         result = _process_test_file(invalid_file, "test_detector")
         self.assertIsNone(result)
 
+    def test_process_test_file(self):
+        """Test extraction of expected results, including inverted annotations."""
+        result = _process_test_file(self.test_file, "test_detector")
+        self.assertEqual(result.true_positives, [6, 10])
+        self.assertEqual(result.true_negatives, [8])
+
+        test_content = """
+        // :true-positive-below: test_detector
+        uint a;
+        // :true-negative-above: test_detector :temporarily-invert-detector-test:
+        """
+        test_file = Path(self.temp_dir) / "inverted.sol"
+        test_file.write_text(test_content)
+
+        result = _process_test_file(test_file, "test_detector")
+        self.assertEqual(result.true_positives, [3, 3])
+        self.assertEqual(result.true_negatives, [])
+
     def test_process_test_file_with_invalid_detector(self):
         """Test processing file with invalid detector name in annotations."""
         test_content = """
@@ -109,6 +128,40 @@ class TestTestRunner(unittest.TestCase):
         )
         self.assertEqual(findings[self.test_file], {5})
 
+    def test_extract_detector_findings_matches_each_path_once(self):
+        """Test that test file paths are indexed and other paths matched only once."""
+        outside_path = Path(self.temp_dir).parent / "outside.sol"
+        mock_response = MagicMock()
+        mock_response.findings = [
+            MagicMock(
+                instances=[
+                    MagicMock(
+                        location=MagicMock(
+                            path=path, position=MagicMock(start=MagicMock(line=line))
+                        )
+                    )
+                    for path, line in [
+                        (self.test_file, 5),
+                        (Path("test.sol"), 6),
+                        (outside_path, 7),
+                        (outside_path, 8),
+                    ]
+                ]
+            )
+        ]
+
+        with patch(
+            "inspector.detector_tester.test_runner._match_test_file",
+            return_value=None,
+        ) as match_test_file:
+            findings = _extract_detector_findings(
+                mock_response, {self.test_file}, Path(self.temp_dir)
+            )
+
+        self.assertEqual(findings, {self.test_file: {5, 6}})
+        match_test_file.assert_called_once()
+        self.assertEqual(match_test_file.call_args.args[0], outside_path)
+
     def test_extract_detector_findings_with_invalid_path(self):
         """Test finding extraction with invalid file path."""
         mock_response = MagicMock()
@@ -245,6 +298,14 @@ class TestTestRunner(unittest.TestCase):
         self.assertNotIn(":true-negative-here:", cleaned)
         self.assertNotIn(":temporarily-invert-detector-test:", cleaned)
 
+        # Only the annotated comment is removed; code and other comments stay
+        self.assertEqual(
+            _remove_test_annotations(
+                "uint a; /// :true-positive-here: test_detector // keep\nuint b;\n"
+            ),
+            "uint a; // keep\nuint b;\n",
+        )
+
     def test_run_detector_tests_with_no_detectors(self):
         """Test running tests with no available detectors."""
         with patch(
@@ -1,36 +1,114 @@
 #!/usr/bin/env python3
 
-import json
+import os
 import sys
-import argparse
-from typing import Dict, List, Any
-from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+# argparse, and json when orjson is missing, are imported only where they are
+# used: this runs as a fresh process for every scan, so startup time counts.
+#
+# Executable scanners are standalone programs that cannot rely on the inspector
+# package being importable, so this keeps its own orjson fallback rather than
+# using inspector._json.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def print_json(obj: Any) -> None:
+    """
+    Write obj to stdout as JSON, followed by a newline.
+
+    The output is compact for the Inspector, which parses it, and indented only
+    when stdout is a terminal.
+    """
+    if not sys.stdout.isatty():
+        data = dumps(obj)
+    elif orjson:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        import json
+
+        data = json.dumps(obj, indent=2).encode()
+    sys.stdout.buffer.write(data + b"\n")
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode obj as compact JSON bytes."""
+    if orjson:
+        return orjson.dumps(obj)
+    import json
+
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+# Scanner metadata; constant, so it is built once.
+_METADATA = {
+    "name": "mock_executable_scanner",
+    "version": "1.0.0",
+    "description": "A mock scanner for testing OpenZeppelin Inspector",
+    "org": "OpenZeppelin",
+    "extensions": [".sol"],
+    "detectors": [
+        {
+            "id": "mock-detector",
+            "uid": "MOCK001",
+            "description": "A mock detector that always finds issues",
+            "severity": "HIGH",
+            "tags": ["mock", "test"],
+            "template": {
+                "title": "Mock Finding",
+                "opening": "This is a mock finding for testing purposes.",
+                "body-list-item-intro": "The following instances were found:",
+                "body-list-item-always": "- On line $instance_line of [`$file_name`]($instance_line_link)",
+                "closing": "This is a mock finding and should be ignored.",
+            },
+        }
+    ],
+}
 
 
 def get_metadata() -> Dict[str, Any]:
     """Return metadata about the scanner and its detectors."""
+    return _METADATA
+
+
+def relative_to_root(files: List[str], project_root: str) -> List[str]:
+    """Return each file's path relative to project_root."""
+    root = os.path.normpath(os.fspath(project_root))
+    prefix = root.rstrip(os.sep) + os.sep
+    # The harness passes files under the root, so once both are normalized,
+    # stripping the prefix is enough; anything else goes through os.path.relpath
+    normalized = map(os.path.normpath, files)
+    return [
+        (
+            file_path[len(prefix) :]
+            if file_path.startswith(prefix)
+            else os.path.relpath(file_path, root)
+        )
+        for file_path in normalized
+    ]
+
+
+# Parts of every mock finding that do not depend on the file. They are shared by
+# all findings, which are only ever serialized, never modified.
+_FIXES = ["// Mock fix suggestion"]
+_EXTRA = {"metavars": {"CONTRACT_NAME": "MockContract"}}
+
+
+def mock_finding(relative_path: str) -> Dict[str, Any]:
+    """Return the mock finding reported for a scanned file."""
     return {
-        "name": "mock_executable_scanner",
-        "version": "1.0.0",
-        "description": "A mock scanner for testing OpenZeppelin Inspector",
-        "org": "OpenZeppelin",
-        "extensions": [".sol"],
-        "detectors": [
+        "instances": [
             {
-                "id": "mock-detector",
-                "uid": "MOCK001",
-                "description": "A mock detector that always finds issues",
-                "severity": "HIGH",
-                "tags": ["mock", "test"],
-                "template": {
-                    "title": "Mock Finding",
-                    "opening": "This is a mock finding for testing purposes.",
-                    "body-list-item-intro": "The following instances were found:",
-                    "body-list-item-always": "- On line $instance_line of [`$file_name`]($instance_line_link)",
-                    "closing": "This is a mock finding and should be ignored.",
-                },
+                "path": relative_path,
+                "offset_start": 0,
+                "offset_end": 10,
+                "fixes": _FIXES,
+                "extra": _EXTRA,
             }
-        ],
+        ]
     }
 
 
@@ -38,37 +116,76 @@ def scan_files(
     files: List[str], project_root: str, detectors: List[str]
 ) -> Dict[str, Any]:
     """Mock scanner that returns a simple analysis result following the required format."""
-    # Convert project_root to Path for easier path manipulation
-    project_root_path = Path(project_root)
+    # Relative paths are computed once and shared by the findings and `scanned`
+    relative_paths = relative_to_root(files, project_root)
 
     # Generate mock findings for each file
-    findings = []
-    for file_path in files:
-        # Convert to relative path
-        relative_path = str(Path(file_path).relative_to(project_root_path))
-
-        findings.append(
-            {
-                "instances": [
-                    {
-                        "path": relative_path,
-                        "offset_start": 0,
-                        "offset_end": 10,
-                        "fixes": ["// Mock fix suggestion"],
-                        "extra": {"metavars": {"CONTRACT_NAME": "MockContract"}},
-                    }
-                ]
-            }
-        )
+    findings = [mock_finding(relative_path) for relative_path in relative_paths]
 
     return {
         "errors": [],
-        "scanned": [str(Path(f).relative_to(project_root_path)) for f in files],
+        "scanned": relative_paths,
         "responses": {"mock-detector": {"findings": findings, "errors": []}},
     }
 
 
-def main():
+def stream_scan(files: List[str], project_root: str, out: BinaryIO) -> None:
+    """
+    Write the scan_files() result to out as compact JSON, encoding one finding
+    at a time instead of building the whole findings list first.
+    """
+    relative_paths = relative_to_root(files, project_root)
+    # Findings differ only in their path: encode the rest once, around an
+    # empty path, and splice each encoded path in between
+    head, tail = dumps(mock_finding("")).split(b'""', 1)
+
+    out.write(b'{"errors":[],"scanned":')
+    out.write(dumps(relative_paths))
+    out.write(b',"responses":{"mock-detector":{"findings":[')
+    for index, relative_path in enumerate(relative_paths):
+        if index:
+            out.write(b",")
+        out.write(head)
+        out.write(dumps(relative_path))
+        out.write(tail)
+    out.write(b'],"errors":[]}}}\n')
+
+
+def parse_scan_args(args: List[str]) -> Optional[Tuple[List[str], str]]:
+    """
+    Split the arguments of a `scan` command into files and project root.
+
+    Handles the well-formed command line the Inspector sends without argparse.
+    Returns None for anything else (help, unknown options, missing arguments),
+    leaving it to argparse to report.
+    """
+    files, project_root = [], None
+    index = 0
+    while index < len(args):
+        arg = args[index]
+        if arg == "--project-root" and index + 1 < len(args):
+            project_root = args[index + 1]
+            index += 2
+        elif arg == "--detectors":
+            # Detector names run up to the next option; they are not used
+            index += 1
+            while index < len(args) and not args[index].startswith("-"):
+                index += 1
+        elif arg.startswith("-"):
+            return None
+        else:
+            files.append(arg)
+            index += 1
+
+    if not files or project_root is None:
+        return None
+    return files, project_root
+
+
+def parse_args(argv: List[str]):
+    """Parse the command line with argparse, reporting usage errors."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Mock scanner for OpenZeppelin Inspector"
     )
@@ -85,16 +202,26 @@ def main():
     )
     scan_parser.add_argument("--detectors", nargs="+", help="Detectors to run")
 
-    args = parser.parse_args()
-
-    if args.command == "metadata":
-        print(json.dumps(get_metadata(), indent=2))
-    elif args.command == "scan":
-        result = scan_files(
-            args.files, args.project_root, args.detectors or ["mock-detector"]
-        )
-        print(json.dumps(result, indent=2))
+    return parser.parse_args(argv)
 
 
+# The script only ever runs as a fresh process, so the common commands are
+# dispatched right here; argparse is set up only for anything else.
 if __name__ == "__main__":
-    main()
+    argv = sys.argv[1:]
+    # Scans can list many files; split them off without argparse when possible
+    scan_args = parse_scan_args(argv[1:]) if argv[:1] == ["scan"] else None
+
+    if argv == ["metadata"]:
+        print_json(get_metadata())
+    elif scan_args is not None:
+        # The output is written a finding at a time; a 64 KiB buffer turns
+        # that into few write() calls
+        with open(sys.stdout.fileno(), "wb", buffering=1 << 16, closefd=False) as out:
+            stream_scan(*scan_args, out)
+    else:
+        args = parse_args(argv)
+        if args.command == "metadata":
+            print_json(get_metadata())
+        elif args.command == "scan":
+            stream_scan(args.files, args.project_root, sys.stdout.buffer)
@@ -1,3 +1,6 @@
+import os
+import stat
+from functools import cache
 from pathlib import Path
 from typing_extensions import override
 
@@ -16,13 +19,37 @@ from inspector.models._complete.scanner_response import CompleteScannerResponse
 from .constants import DETECTOR_TEST_PATH
 
 
+@cache
+def _get_root_test_dirs() -> list[Path]:
+    """
+    Get a list of root test directories provided by this scanner.
+
+    These directories will be treated as additional root test directories
+    by the Inspector Test Framework, which will handle the actual test file
+    discovery and organization. The filesystem is checked once per process.
+
+    Returns:
+        A list of Path objects pointing to root test directories.
+    """
+    # One stat call answers both "exists" and "is a directory"
+    try:
+        is_dir = stat.S_ISDIR(os.stat(DETECTOR_TEST_PATH).st_mode)
+    except OSError:
+        is_dir = False
+    return [DETECTOR_TEST_PATH] if is_dir else []
+
+
 class MockScanner(BaseScanner):
     """A simplified mock scanner for demonstration purposes."""
 
+    # Per-instance data that never changes, shared by every reported instance
+    _EXTRA = Extra(metavars={"_CONTRACT_NAME": "MockContract"})
+    _NO_FIXES: list[str] = []
+
     def __init__(self) -> None:
         super().__init__()
         # Predefined mock data
-        self._detector_names = ["mock-test"]
+        self._detector_names = frozenset({"mock-test"})
         self._detector_metadata = {
             "mock-test": {
                 "id": "mock-test",
@@ -56,28 +83,7 @@ class MockScanner(BaseScanner):
 
     @override
     def get_root_test_dirs(self) -> list[Path]:
-        return self._get_root_test_dirs()
-
-    @classmethod
-    def _get_root_test_dirs(cls) -> list[Path]:
-        """
-        Get a list of root test directories provided by this scanner.
-
-        These directories will be treated as additional root test directories
-        by the Inspector Test Framework, which will handle the actual test file
-        discovery and organization.
-
-        Returns:
-            A list of Path objects pointing to root test directories.
-        """
-        if not hasattr(cls, "_cached_root_test_dirs"):
-            # Cache the result to avoid repeated filesystem operations
-            if DETECTOR_TEST_PATH.exists() and DETECTOR_TEST_PATH.is_dir():
-                cls._cached_root_test_dirs = [DETECTOR_TEST_PATH]
-            else:
-                cls._cached_root_test_dirs = []
-
-        return cls._cached_root_test_dirs
+        return _get_root_test_dirs()
 
     def run(
         self,
@@ -87,6 +93,8 @@ class MockScanner(BaseScanner):
     ) -> CompleteScannerResponse:
         """Return mock findings without actually running any detectors."""
 
+        # Every finding points at the first scanned file
+        first_path = os.fspath(code_paths[0])
         detector_responses = {}
 
         for detector_name in detector_names:
@@ -94,11 +102,11 @@ class MockScanner(BaseScanner):
                 finding = MinimalFinding()
 
                 instance = MinimalInstance(
-                    path=str(code_paths[0]),
+                    path=first_path,
                     offset_start=0,
                     offset_end=0,
-                    extra=Extra(metavars={"_CONTRACT_NAME": "MockContract"}),
-                    fixes=[],
+                    extra=self._EXTRA,
+                    fixes=self._NO_FIXES,
                 )
 
                 finding.instances.append(instance)
@@ -113,6 +121,6 @@ class MockScanner(BaseScanner):
 
         return CompleteScannerResponse(
             errors=[],
-            scanned=[str(code_paths[0])],
+            scanned=[first_path],
             responses=detector_responses,
         )